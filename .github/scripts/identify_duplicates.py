@@ -12,6 +12,7 @@ import os
 import sys
 from datetime import datetime, timedelta
 
+import numpy as np
 from github import Github
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -60,8 +61,6 @@ class GithubDuplicateIssueDetector:
 
         # Combine title and body for better comparison
         current_issue_text = f"{issue_title}\n{issue_body}"
-        existing_issues = []
-        issue_texts = []
 
         # Get and count open issues
         open_issues = list(self.repo.get_issues(state="open"))
@@ -71,18 +70,9 @@ class GithubDuplicateIssueDetector:
         recently_closed_issues = list(self.repo.get_issues(state="closed", since=thirty_days_ago))
         logging.info(f"Found {len(recently_closed_issues)} recently closed issues (last 30 days)")
 
-        # Process both sets of issues
-        for issue_set, set_type in [
-            (open_issues, "open"),
-            (recently_closed_issues, "closed"),
-        ]:
-            for issue in issue_set:
-                if issue.number == current_issue_number:
-                    logging.info(f"Skipping current issue #{issue.number} ({set_type})")
-                    continue
-
-                existing_issues.append(issue)
-                issue_texts.append(f"{issue.title}\n{issue.body or ''}")
+        # Drop the current issue once up front instead of branching on every candidate
+        existing_issues = [issue for issue in open_issues + recently_closed_issues if issue.number != current_issue_number]
+        issue_texts = [f"{issue.title}\n{issue.body or ''}" for issue in existing_issues]
 
         if not issue_texts:
             logging.info("No existing issues found to compare against")
@@ -94,19 +84,21 @@ class GithubDuplicateIssueDetector:
         tfidf_matrix = self.vectorizer.fit_transform(all_texts)
         similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
 
-        # Log all similarity scores
-        for i, similarity in enumerate(similarities):
-            logging.info(f"Issue #{existing_issues[i].number}: {existing_issues[i].title} - Similarity: {similarity:.1%}")
+        # Log all similarity scores; skip the per-issue formatting entirely unless DEBUG output is enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for issue, similarity in zip(existing_issues, similarities, strict=True):
+                logging.debug(f"Issue #{issue.number}: {issue.title} - Similarity: {similarity:.1%}")
 
-        # Filter issues that exceed threshold
+        # Filter issues that exceed threshold and order by descending similarity in one vectorized pass
+        above = np.flatnonzero(similarities >= threshold)
+        above = above[np.argsort(-similarities[above], kind="stable")]
         similar_issues = [
             (
                 existing_issues[i],
-                similarities[i],
+                float(similarities[i]),
                 "closed" if existing_issues[i].state == "closed" else "open",
             )
-            for i in range(len(similarities))
-            if similarities[i] >= threshold
+            for i in above
         ]
 
         if similar_issues:
@@ -117,7 +109,7 @@ class GithubDuplicateIssueDetector:
         else:
             logging.info(f"No issues found above similarity threshold {threshold:.1%}")
 
-        return sorted(similar_issues, key=lambda x: x[1], reverse=True)
+        return similar_issues
 
     def create_similarity_comment(self, issue_number, similar_issues):
         """Create a comment on the issue with similarity results."""
@@ -125,16 +117,17 @@ class GithubDuplicateIssueDetector:
             logging.info("No similar issues found, skipping comment creation")
             return
 
-        comment_body = f"{DUPLICATE_COMMENT_MARKER}\n\n"
-        comment_body += f"Issues with similarity score >= {similar_issues[0][1]:.1%}:\n\n"
-
-        for similar_issue, similarity, state in similar_issues[:5]:
-            status_emoji = "🟢" if state == "open" else "🔴"
-            comment_body += (
-                f"{status_emoji} #{similar_issue.number}: [{similar_issue.title}]({similar_issue.html_url})\n"
-                f"   - Similarity: {similarity:.1%}\n"
-                f"   - Status: {state}\n\n"
-            )
+        sections = [
+            f"{DUPLICATE_COMMENT_MARKER}\n\n",
+            f"Issues with similarity score >= {similar_issues[0][1]:.1%}:\n\n",
+        ]
+        sections.extend(
+            f"{'🟢' if state == 'open' else '🔴'} #{similar_issue.number}: [{similar_issue.title}]({similar_issue.html_url})\n"
+            f"   - Similarity: {similarity:.1%}\n"
+            f"   - Status: {state}\n\n"
+            for similar_issue, similarity, state in similar_issues[:5]
+        )
+        comment_body = "".join(sections)
 
         logging.info(f"Creating comment on issue #{issue_number} with {len(similar_issues[:5])} similar issues")
         issue = self.repo.get_issue(number=issue_number)
@@ -8,9 +8,11 @@ The module provides functionality for:
 4. Environment-based issue data retrieval
 """
 
+import hashlib
 import json
 import logging
 import os
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -37,6 +39,7 @@ from my_chat_gpt_utils.openai_utils import (
     DEFAULT_LLM_MODEL,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TEMPERATURE,
+    LLMResponseCache,
     OpenAIConfig,
     OpenAIValidator,
     OpenAIVersionChecker,
@@ -74,7 +77,7 @@ def _normalize_next_steps(steps: Any) -> list[str]:
     return out
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueAnalysis:
     """
     Represents the analysis results of a GitHub issue.
@@ -96,6 +99,10 @@ class IssueAnalysis:
     next_steps: list[str]
 
 
+# Fields the LLM response must contain; the others have defaults in analyze_issue
+REQUIRED_ANALYSIS_FIELDS = ("issue_type", "priority", "complexity")
+
+
 def is_issue_analyzer_mock_llm() -> bool:
     """Return True when ``ISSUE_ANALYZER_MOCK_LLM`` requests canned analysis (no OpenAI call)."""
 
@@ -121,6 +128,9 @@ def _mock_issue_analysis_from_issue_data(issue_data: dict[str, Any]) -> IssueAna
 class LLMIssueAnalyzer:
     """Analyzes GitHub issues using a Language Model."""
 
+    # Maximum number of distinct prompts whose responses are kept
+    response_cache_size = 256
+
     def __init__(self, config: OpenAIConfig):
         """
         Initialize the analyzer with OpenAI configuration.
@@ -132,6 +142,90 @@ class LLMIssueAnalyzer:
         """
         self.config = config
         self.client = openai.OpenAI(api_key=config.api_key)
+        # Prompt hash -> validated response content, so identical issues are only sent to OpenAI once
+        self._response_cache: dict[str, str | bytes | bytearray] = {}
+        # Guards lookups, inserts and eviction, since one analyzer may serve several threads
+        self._response_cache_lock = threading.Lock()
+        # Same keys on disk, so re-runs of a process can skip the API as well
+        self._disk_cache = LLMResponseCache.from_env()
+
+    def _cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        """Return a compact key identifying a request by its model, sampling settings and prompts."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.config.model, str(self.config.temperature), str(self.config.max_tokens), system_prompt, user_prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _cache_content(self, cache_key: str, content: str | bytes | bytearray) -> None:
+        """Remember a response that parsed into a valid analysis, evicting the oldest entry when full."""
+        with self._response_cache_lock:
+            if cache_key not in self._response_cache and len(self._response_cache) >= self.response_cache_size:
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[cache_key] = content
+
+    def _request_content(self, system_prompt: str, user_prompt: str) -> str | bytes | bytearray:
+        """
+        Send the prompts to OpenAI and return the validated message content.
+
+        Args:
+        ----
+            system_prompt (str): System prompt for the analysis.
+            user_prompt (str): User prompt describing the issue.
+
+        Returns:
+        -------
+            str | bytes | bytearray: Raw content of the first choice.
+
+        Raises:
+        ------
+            ProblemCauseSolution: If the response does not have the expected structure
+
+        """
+        # Call OpenAI API
+        response = self.client.chat.completions.create(
+            model=self.config.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            # JSON mode guarantees a parseable object, matching the json.loads in analyze_issue
+            response_format={"type": "json_object"},
+        )
+
+        # Validate response structure
+        if not hasattr(response, "choices") or not response.choices:
+            raise ProblemCauseSolution(
+                problem="Invalid OpenAI API response",
+                cause="Response missing 'choices' array",
+                solution="Check if the OpenAI API endpoint is correct and returning expected format",
+            )
+
+        if not hasattr(response.choices[0], "message"):
+            raise ProblemCauseSolution(
+                problem="Invalid OpenAI API response",
+                cause="Response missing 'message' in first choice",
+                solution="Check if the OpenAI API endpoint is correct and returning expected format",
+            )
+
+        if not hasattr(response.choices[0].message, "content"):
+            raise ProblemCauseSolution(
+                problem="Invalid OpenAI API response",
+                cause="Response missing 'content' in message",
+                solution="Check if the OpenAI API endpoint is correct and returning expected format",
+            )
+
+        # Get and validate content
+        content = response.choices[0].message.content
+        if not isinstance(content, (str, bytes, bytearray)):
+            raise ProblemCauseSolution(
+                problem="Invalid OpenAI API response content",
+                cause=f"Unexpected content type: {type(content)}",
+                solution="Check if the OpenAI API endpoint is returning text content as expected",
+            )
+        return content
 
     def analyze_issue(self, issue_data: dict[str, Any]) -> IssueAnalysis:
         """
@@ -175,48 +269,17 @@ class LLMIssueAnalyzer:
                 original_exception=e,
             )
 
+        cache_key = self._cache_key(system_prompt, user_prompt)
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-            )
-
-            # Validate response structure
-            if not hasattr(response, "choices") or not response.choices:
-                raise ProblemCauseSolution(
-                    problem="Invalid OpenAI API response",
-                    cause="Response missing 'choices' array",
-                    solution="Check if the OpenAI API endpoint is correct and returning expected format",
-                )
-
-            if not hasattr(response.choices[0], "message"):
-                raise ProblemCauseSolution(
-                    problem="Invalid OpenAI API response",
-                    cause="Response missing 'message' in first choice",
-                    solution="Check if the OpenAI API endpoint is correct and returning expected format",
-                )
-
-            if not hasattr(response.choices[0].message, "content"):
-                raise ProblemCauseSolution(
-                    problem="Invalid OpenAI API response",
-                    cause="Response missing 'content' in message",
-                    solution="Check if the OpenAI API endpoint is correct and returning expected format",
-                )
-
-            # Get and validate content
-            content = response.choices[0].message.content
-            if not isinstance(content, (str, bytes, bytearray)):
-                raise ProblemCauseSolution(
-                    problem="Invalid OpenAI API response content",
-                    cause=f"Unexpected content type: {type(content)}",
-                    solution="Check if the OpenAI API endpoint is returning text content as expected",
-                )
+            with self._response_cache_lock:
+                content = self._response_cache.get(cache_key)
+            if content is None and self._disk_cache is not None:
+                content = self._disk_cache.get(cache_key)
+            from_api = content is None
+            if from_api:
+                content = self._request_content(system_prompt, user_prompt)
+            else:
+                logger.info("Reusing the cached OpenAI analysis for an identical prompt.")
 
             # Parse response
             try:
@@ -231,8 +294,7 @@ class LLMIssueAnalyzer:
                 )
 
             # Validate required fields
-            required_fields = ["issue_type", "priority", "complexity"]
-            missing_fields = [field for field in required_fields if field not in analysis_dict]
+            missing_fields = [field for field in REQUIRED_ANALYSIS_FIELDS if field not in analysis_dict]
             if missing_fields:
                 raise ProblemCauseSolution(
                     problem="Incomplete analysis results",
@@ -243,6 +305,9 @@ class LLMIssueAnalyzer:
             review_raw = analysis_dict.get("review_feedback", "")
             review_feedback = _normalize_escapes(review_raw if isinstance(review_raw, str) else str(review_raw))
 
+            self._cache_content(cache_key, content)
+            if from_api and self._disk_cache is not None:
+                self._disk_cache.set(cache_key, content)
             return IssueAnalysis(
                 issue_type=analysis_dict["issue_type"],
                 priority=analysis_dict["priority"],
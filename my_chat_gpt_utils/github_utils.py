@@ -4,17 +4,24 @@ import datetime
 import json
 import logging
 import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
+import numpy as np
 import requests
 from github import Github
 from github.GithubException import BadCredentialsException, GithubException, RateLimitExceededException
 from github.Issue import Issue
 from github.NamedUser import NamedUser
 from github.Repository import Repository
-from sklearn.feature_extraction.text import TfidfVectorizer
+from requests.adapters import HTTPAdapter
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.pipeline import Pipeline
+from urllib3.util.retry import Retry
 
 from my_chat_gpt_utils.exceptions import GithubAuthenticationError, ProblemCauseSolution
 
@@ -64,7 +71,9 @@ __all__ = [
     "get_github_issue",
     "append_response_to_issue",
     "ISSUE_TYPES",
+    "ISSUE_TYPES_STR",
     "PRIORITY_LEVELS",
+    "PRIORITY_LEVELS_STR",
     "IssueContext",
     "IssueRetriever",
     "IssueSimilarityAnalyzer",
@@ -77,6 +86,9 @@ __all__ = [
 # Constants for tags, priority levels, and issue types
 ISSUE_TYPES = ["Epic", "Change Request", "Bug Fix", "Task", "Question"]
 PRIORITY_LEVELS = ["Critical", "High", "Medium", "Low"]
+# Comma-separated forms for prompts, joined once at import
+ISSUE_TYPES_STR = ", ".join(ISSUE_TYPES)
+PRIORITY_LEVELS_STR = ", ".join(PRIORITY_LEVELS)
 
 
 @dataclass
@@ -106,9 +118,18 @@ class IssueContext:
 class IssueRetriever:
     """Service for retrieving and filtering GitHub issues."""
 
-    def __init__(self, repository: Any):
-        """Initialize the issue retriever with a GitHub repository."""
+    def __init__(self, repository: Any, clock: Callable[[], datetime.datetime] | None = None):
+        """
+        Initialize the issue retriever with a GitHub repository.
+
+        Args:
+        ----
+            repository (Any): GitHub repository to retrieve issues from
+            clock (Callable[[], datetime], optional): Returns the current UTC time; defaults to the system clock
+
+        """
         self.repository = repository
+        self._clock = clock or (lambda: datetime.datetime.now(datetime.UTC))
 
     def get_recent_issues(self, state: str = "all", days_back: int = 30) -> list[Any]:
         """
@@ -124,12 +145,16 @@ class IssueRetriever:
             List[Any]: List of issues created within the specified time window
 
         """
-        since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=days_back)
-        # Get issues from GitHub API with since parameter
-        issues = self.repository.get_issues(state=state, since=since)
-        # Double-check the date filter since GitHub API's since parameter isn't always reliable
-        cutoff_date = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=days_back)
-        return [issue for issue in issues if issue.created_at >= cutoff_date]
+        since = self._clock() - datetime.timedelta(days=days_back)
+        # GitHub's since parameter filters on update time, so also request newest-created first
+        issues = self.repository.get_issues(state=state, since=since, sort="created", direction="desc")
+        recent_issues = []
+        for issue in issues:
+            if issue.created_at < since:
+                # Every remaining issue is older: stop before fetching further pages
+                break
+            recent_issues.append(issue)
+        return recent_issues
 
 
 class IssueSimilarityAnalyzer:
@@ -137,7 +162,11 @@ class IssueSimilarityAnalyzer:
 
     def __init__(self, similarity_threshold: float = 0.8):
         """
-        Initialize the analyzer with TF-IDF vectorizer.
+        Initialize the analyzer with a hashing TF-IDF vectorizer.
+
+        Terms are hashed into a fixed feature space instead of building a vocabulary, which keeps
+        vectorizing short issue texts cheap; the trade-off is that features cannot be mapped back
+        to terms (there is no get_feature_names_out).
 
         Args:
         ----
@@ -145,9 +174,19 @@ class IssueSimilarityAnalyzer:
                                        Defaults to 0.8 for longer issues, but can be lower for testing.
 
         """
-        self.vectorizer = TfidfVectorizer(stop_words="english")
+        self.vectorizer = Pipeline(
+            [
+                ("hashing", HashingVectorizer(stop_words="english", n_features=2**14, alternate_sign=False, norm=None)),
+                ("tfidf", TfidfTransformer()),
+            ]
+        )
         self.similarity_threshold = similarity_threshold
 
+    @staticmethod
+    def _issue_text(issue: Any) -> str:
+        """Return the text of an issue that is vectorized: its title and body."""
+        return f"{issue.title}\n{issue.body or ''}"
+
     def compute_similarities(
         self,
         current_issue: Any,
@@ -165,23 +204,25 @@ class IssueSimilarityAnalyzer:
 
         Returns:
         -------
-            List[Tuple[Any, float]]: List of (issue, similarity) tuples for issues above threshold.
+            List[Tuple[Any, float]]: List of (issue, similarity) tuples for issues above threshold,
+                                     sorted by descending similarity.
 
         """
-        if not comparable_issues:
+        current_text = self._issue_text(current_issue)
+        if not comparable_issues or not current_text.strip():
+            # Nothing to compare, or an issue without text: skip vectorizing altogether
             return []
 
-        current_text = f"{current_issue.title}\n{current_issue.body or ''}"
-        comparable_texts = [f"{issue.title}\n{issue.body or ''}" for issue in comparable_issues]
-
-        all_texts = comparable_texts + [current_text]
-        tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+        comparable_texts = [self._issue_text(issue) for issue in comparable_issues]
+        tfidf_matrix = self.vectorizer.fit_transform(comparable_texts + [current_text])
         similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
 
         # Use provided threshold or fall back to default
         threshold_to_use = threshold if threshold is not None else self.similarity_threshold
-        # Filter issues above threshold
-        return [(issue, score) for issue, score in zip(comparable_issues, similarities, strict=False) if score >= threshold_to_use]
+        # Filter issues above threshold with one vectorized comparison, most similar first
+        indices = np.flatnonzero(similarities >= threshold_to_use)
+        indices = indices[np.argsort(-similarities[indices], kind="stable")]
+        return [(comparable_issues[i], float(similarities[i])) for i in indices]
 
 
 class GithubClientFactory:
@@ -399,15 +440,10 @@ def create_issue(repo, title: str, body: str, labels: list = None):
 
 
 def edit_issue(issue, title: str = None, body: str = None, state: str = None, labels: list = None):
-    """Edit an existing issue."""
-    if title:
-        issue.edit(title=title)
-    if body:
-        issue.edit(body=body)
-    if state:
-        issue.edit(state=state)
-    if labels:
-        issue.edit(labels=labels)
+    """Edit an existing issue, sending all given fields in a single request."""
+    changes = {name: value for name, value in (("title", title), ("body", body), ("state", state), ("labels", labels)) if value}
+    if changes:
+        issue.edit(**changes)
 
 
 def add_comment(issue, comment: str):
@@ -431,6 +467,14 @@ def append_response_to_issue(client: Any, repo_name: str, issue_data: dict[str,
 class GitHubLabelManager:
     """Class to manage GitHub issue labels."""
 
+    # Upper bound on simultaneous REST calls, to stay clear of GitHub's secondary rate limits
+    max_concurrent_requests = 10
+
+    # (owner, repo) -> label names known to exist, shared by all managers in the process
+    _label_cache: ClassVar[dict[tuple[str, str], set[str]]] = {}
+    # (owner, repo) -> ETag of the label listing the cached names came from
+    _label_etags: ClassVar[dict[tuple[str, str], str]] = {}
+
     def __init__(self, github_token: str):
         """
         Initialize GitHubLabelManager.
@@ -445,6 +489,33 @@ class GitHubLabelManager:
             "Authorization": f"token {github_token}",
             "Accept": "application/vnd.github.v3+json",
         }
+        # One pooled adapter keeps connections alive across label calls; only idempotent requests are retried
+        self._adapter = HTTPAdapter(
+            pool_connections=self.max_concurrent_requests,
+            pool_maxsize=self.max_concurrent_requests,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self._session = self._new_session()
+        # Sessions for the label-creation worker threads, one per thread
+        self._worker_sessions = threading.local()
+
+    def _new_session(self) -> requests.Session:
+        """
+        Return a session that sends its requests through the shared pooled adapter.
+
+        The adapter's urllib3 connection pool is thread-safe, but a Session's cookie jar and
+        settings are not, so each thread gets its own Session on top of the one adapter.
+        """
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        return session
+
+    def _worker_session(self) -> requests.Session:
+        """Return the session of the calling worker thread, creating it on first use."""
+        session = getattr(self._worker_sessions, "session", None)
+        if session is None:
+            session = self._worker_sessions.session = self._new_session()
+        return session
 
     def ensure_labels_exist(self, repo_owner: str, repo_name: str, labels: list[str], color: str = "6f42c1") -> None:
         """
@@ -464,20 +535,32 @@ class GitHubLabelManager:
         """
         url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/labels"
 
-        try:
-            # Get existing labels
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            existing_labels = [label["name"] for label in response.json()]
+        cache_key = (repo_owner, repo_name)
+        known_labels = self._label_cache.get(cache_key)
 
-            # Create missing labels
-            for label in labels:
-                if label not in existing_labels:
-                    label_data = {"name": label, "color": color}
-                    response = requests.post(url, headers=self.headers, json=label_data)
+        try:
+            if known_labels is None or not known_labels.issuperset(labels):
+                # Get existing labels; a label may have been created elsewhere, so revalidate the cached listing
+                known_labels = self._list_labels(url, cache_key, known_labels)
+
+            # Create missing labels concurrently; the POSTs are independent, so their round-trips overlap
+            missing = [label for label in labels if label not in known_labels]
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(len(missing), self.max_concurrent_requests)) as executor:
+                    label_payloads = [{"name": label, "color": color} for label in missing]
+                    responses = list(
+                        executor.map(lambda data: self._worker_session().post(url, headers=self.headers, json=data), label_payloads)
+                    )
+                for label, response in zip(missing, responses, strict=True):
                     response.raise_for_status()
+                    known_labels.add(label)
         except requests.exceptions.RequestException as e:
-            if response.status_code == 403:
+            # The repository's labels are no longer known for certain: list them again next time
+            self._label_cache.pop(cache_key, None)
+            self._label_etags.pop(cache_key, None)
+            # Connection errors carry no response, so the status comes from the exception, not a local variable
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if status_code == 403:
                 raise ProblemCauseSolution(
                     problem="Failed to manage repository labels",
                     cause="Insufficient permissions to manage labels",
@@ -487,11 +570,33 @@ class GitHubLabelManager:
             else:
                 raise ProblemCauseSolution(
                     problem="Failed to manage repository labels",
-                    cause=f"GitHub API request failed with status {response.status_code}",
+                    cause=f"GitHub API request failed with status {status_code}" if status_code else f"GitHub API error: {e!s}",
                     solution="Check the GitHub API documentation for more information about this error",
                     original_exception=e,
                 )
 
+    def _list_labels(self, url: str, cache_key: tuple[str, str], known_labels: set[str] | None) -> set[str]:
+        """
+        List the repository's labels, revalidating a cached listing with its ETag.
+
+        A 304 Not Modified carries no body and does not count against GitHub's rate limit,
+        so the cached names are reused as they are.
+        """
+        etag = self._label_etags.get(cache_key)
+        headers = self.headers if known_labels is None or etag is None else {**self.headers, "If-None-Match": etag}
+        response = self._session.get(url, headers=headers)
+        response.raise_for_status()
+        if response.status_code == 304 and known_labels is not None:
+            return known_labels
+
+        known_labels = self._label_cache[cache_key] = {label["name"] for label in response.json()}
+        etag = response.headers.get("ETag")
+        if etag:
+            self._label_etags[cache_key] = etag
+        else:
+            self._label_etags.pop(cache_key, None)
+        return known_labels
+
     def add_labels_to_issue(self, repo_owner: str, repo_name: str, issue_number: int, labels: list[str]) -> bool:
         """
         Add labels to a GitHub issue.
@@ -516,7 +621,7 @@ class GitHubLabelManager:
         response = None
 
         try:
-            response = requests.post(url, headers=self.headers, json={"labels": labels})
+            response = self._session.post(url, headers=self.headers, json={"labels": labels})
             # Check status code first
             if response.status_code == 404:
                 raise ProblemCauseSolution(
@@ -1,13 +1,20 @@
 """Utilities for interacting with OpenAI's API and managing API configurations."""
 
+import hashlib
+import json
 import os
+import time
 from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
 
 import openai
 import requests
 import yaml
 from openai import OpenAI
 from packaging import version
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from my_chat_gpt_utils.logger import logger
 
@@ -16,6 +23,8 @@ DEFAULT_LLM_MODEL = "gpt-3.5-turbo"
 DEFAULT_MAX_TOKENS = 2048
 DEFAULT_TEMPERATURE = 0.1
 REQUIRED_OPENAI_VERSION = "1.65.2"
+DEFAULT_LLM_CACHE_DIR = os.path.join("~", ".cache", "my_chat_gpt", "llm")
+API_KEY_VALIDATION_TIMEOUT = 5  # seconds
 
 
 @dataclass
@@ -71,11 +80,36 @@ class OpenAIVersionChecker:
 class OpenAIValidator:
     """Validates OpenAI API key and permissions."""
 
-    @staticmethod
-    def validate_api_key(api_key: str) -> bool:
+    # Validation results are reused for cache_ttl seconds, keyed by a hash so keys are not held in memory
+    cache_ttl: ClassVar[float] = 600.0
+    cache_size: ClassVar[int] = 32
+    _cache: ClassVar[dict[str, tuple[float, bool]]] = {}
+    # Shared keep-alive session, so repeated validations skip the TCP and TLS handshake
+    _session: ClassVar[requests.Session | None] = None
+
+    @classmethod
+    def _http_session(cls) -> requests.Session:
+        """Return the shared HTTP session, creating it on first use."""
+        if cls._session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+                ),
+            )
+            cls._session = session
+        return cls._session
+
+    @classmethod
+    def validate_api_key(cls, api_key: str) -> bool:
         """
         Validate the OpenAI API key's permissions.
 
+        Results are cached per key for cache_ttl seconds; failed requests are not cached.
+
         Args:
         ----
             api_key (str): OpenAI API key to validate.
@@ -85,18 +119,79 @@ class OpenAIValidator:
             bool: True if key is valid, False otherwise.
 
         """
+        key = hashlib.sha256(api_key.encode()).hexdigest()
+        now = time.monotonic()
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         try:
             headers = {"Authorization": f"Bearer {api_key}"}
-            response = requests.get("https://api.openai.com/v1/models", headers=headers)
-            return response.status_code == 200
+            response = cls._http_session().get(
+                "https://api.openai.com/v1/models",
+                headers=headers,
+                timeout=API_KEY_VALIDATION_TIMEOUT,
+            )
         except Exception as e:
             logger.error(f"API key validation failed: {e}")
             return False
 
+        is_valid = response.status_code == 200
+        if len(cls._cache) >= cls.cache_size:
+            # Drop the oldest entry; dicts keep insertion order
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[key] = (now + cls.cache_ttl, is_valid)
+        return is_valid
+
+
+class LLMResponseCache:
+    """
+    Persistent cache of LLM response content, stored as one file per request key.
+
+    Off by default; set LLM_CACHE=1 (or true/yes) to enable it and LLM_CACHE_DIR to move it.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        """
+        Initialize the cache.
+
+        Args:
+        ----
+            directory (str | os.PathLike): Directory holding the cache entries; ~ is expanded.
+
+        """
+        self.directory = Path(directory).expanduser()
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache | None":
+        """Return the cache configured by the environment, or None unless LLM_CACHE enables it."""
+        if os.getenv("LLM_CACHE", "").strip().lower() not in ("1", "true", "yes"):
+            return None
+        return cls(os.getenv("LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR))
+
+    def get(self, key: str) -> str | None:
+        """Return the cached content for a key, or None on a miss or unreadable entry."""
+        try:
+            return (self.directory / key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, key: str, content: str | bytes | bytearray) -> None:
+        """Store content for a key; failures are logged, as the cache is only an optimization."""
+        text = content if isinstance(content, str) else bytes(content).decode("utf-8")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see a partial entry
+            tmp_path = self.directory / f"{key}.{os.getpid()}.tmp"
+            tmp_path.write_text(text, encoding="utf-8")
+            tmp_path.replace(self.directory / key)
+        except OSError as e:
+            logger.warning(f"Could not write LLM response cache entry: {e}")
+
 
 def parse_openai_response(response_content: str):
     """
-    Parse the OpenAI API response content as YAML.
+    Parse the OpenAI API response content as JSON, falling back to YAML for older responses.
 
     Args:
     ----
@@ -104,38 +199,69 @@ def parse_openai_response(response_content: str):
 
     Returns:
     -------
-        dict: Parsed YAML content as a dictionary.
+        dict: Parsed JSON (or YAML) content as a dictionary.
         text: The response content if parsing fails.
 
     """
+    response_content = response_content.strip("`")  # remove markdown open/close tags
     try:
-        response_content = response_content.strip("`")  # remove markdown open/close tags
+        return json.loads(response_content)
+    except json.JSONDecodeError:
+        pass
+    try:
+        # Responses produced before the prompts switched to JSON were YAML
         return yaml.safe_load(response_content)
     except yaml.YAMLError as e:
         logger.warning(f"YAML parsing failed: {e}")
         return response_content
 
 
-def make_openai_api_call(api_key: str, model: str, messages: list, temperature: float, max_tokens: int):
+# Clients reused by make_openai_api_call, keyed by a hash of their API key ("" for the environment's key)
+_CLIENT_CACHE_SIZE = 8
+_clients: dict[str, OpenAI] = {}
+
+
+def _client_for_api_key(api_key: str | None) -> OpenAI:
+    """Return one OpenAI client per API key, so callers passing a key still reuse its connection pool."""
+    key = "" if api_key is None else hashlib.sha256(api_key.encode()).hexdigest()
+    client = _clients.get(key)
+    if client is None:
+        if len(_clients) >= _CLIENT_CACHE_SIZE:
+            # Drop the oldest client; dicts keep insertion order
+            _clients.pop(next(iter(_clients)))
+        client = _clients[key] = OpenAI(api_key=api_key)
+    return client
+
+
+def make_openai_api_call(
+    api_key: str | None,
+    model: str,
+    messages: list,
+    temperature: float,
+    max_tokens: int,
+    client: OpenAI | None = None,
+):
     """
     Make an OpenAI API call to generate a response.
 
     Args:
     ----
-        api_key (str): OpenAI API key.
+        api_key (str | None): OpenAI API key; ignored when a client is given.
         model (str): LLM model to use.
         messages (list): List of messages for the chat completion.
         temperature (float): Sampling temperature for generation.
         max_tokens (int): Maximum tokens for completion.
+        client (OpenAI, optional): Client to send the request with; by default one client is reused per API key.
 
     Returns:
     -------
         str: The response content from OpenAI API.
 
     """
-    openai.api_key = api_key
+    if client is None:
+        client = _client_for_api_key(api_key)
     try:
-        response = openai.ChatCompletion.create(
+        response = client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
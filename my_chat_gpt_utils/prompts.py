@@ -30,15 +30,18 @@ The current function could leave undefined placeholders in the prompt.
 
 import os
 import tempfile
+from functools import lru_cache
 from typing import Any
 
 # Try to import from my_chat_gpt_utils package, but fallback to constants if running standalone
 try:
-    from my_chat_gpt_utils.github_utils import ISSUE_TYPES, PRIORITY_LEVELS
+    from my_chat_gpt_utils.github_utils import ISSUE_TYPES, ISSUE_TYPES_STR, PRIORITY_LEVELS, PRIORITY_LEVELS_STR
 except ImportError:
     # Define constants for standalone operation
     ISSUE_TYPES = ["Epic", "Change Request", "Bug Fix", "Task", "Question"]
     PRIORITY_LEVELS = ["Critical", "High", "Medium", "Low"]
+    ISSUE_TYPES_STR = ", ".join(ISSUE_TYPES)
+    PRIORITY_LEVELS_STR = ", ".join(PRIORITY_LEVELS)
 
 
 class PlaceholderDict(dict):
@@ -66,6 +69,45 @@ class PlaceholderDict(dict):
         return "{" + key + "}"
 
 
+# Placeholders that differ per issue. They are only substituted in the user prompt: the system prompt
+# must stay byte-identical across issues so the provider's prompt-prefix cache can reuse it.
+ISSUE_PLACEHOLDERS = frozenset({"issue_title", "issue_body"})
+
+
+@lru_cache(maxsize=4)
+def _format_system_prompt(template: str, static_placeholders: tuple[tuple[str, Any], ...]) -> str:
+    """Format the system template once per template and set of static placeholder values."""
+    return template.format_map(PlaceholderDict(static_placeholders))
+
+
+@lru_cache(maxsize=8)
+def _read_template(path: str, mtime_ns: int) -> str:
+    """Read a template file; cached per path and modification time, so edits are still picked up."""
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def load_template(relative_path: str) -> str:
+    """
+    Return the raw text of a prompt template, reading each version of the file only once.
+
+    Args:
+    ----
+        relative_path: Path of the template, relative to the current working directory.
+
+    Returns:
+    -------
+        str: The unformatted template text.
+
+    Raises:
+    ------
+        FileNotFoundError: If the template file does not exist.
+
+    """
+    path = os.path.abspath(relative_path)
+    return _read_template(path, os.stat(path).st_mtime_ns)
+
+
 def load_analyze_issue_prompt(
     placeholders: dict[str, Any] | None = None,
     include_best_practices: bool = False,
@@ -73,6 +115,9 @@ def load_analyze_issue_prompt(
     """
     Load and format the system and user prompts for issue analysis.
 
+    Per-issue placeholders (ISSUE_PLACEHOLDERS) are only substituted in the user prompt, so the
+    system prompt is the same cached string for every issue.
+
     Args:
     ----
         placeholders: Dictionary of placeholder values to substitute in the prompts.
@@ -88,21 +133,21 @@ def load_analyze_issue_prompt(
 
     # Add standard placeholders if not provided
     if "issue_types" not in placeholders:
-        placeholders["issue_types"] = ", ".join(ISSUE_TYPES)
+        placeholders["issue_types"] = ISSUE_TYPES_STR
     if "priority_levels" not in placeholders:
-        placeholders["priority_levels"] = ", ".join(PRIORITY_LEVELS)
+        placeholders["priority_levels"] = PRIORITY_LEVELS_STR
 
     placeholders = PlaceholderDict(placeholders)
 
     try:
-        with open("SuperPrompt/analyze_issue_system_prompt.txt", encoding="utf-8") as file:
-            raw_prompt = file.read()
-        system_prompt = raw_prompt.format_map(placeholders)
-
-        with open("SuperPrompt/analyze_issue_user_prompt.txt", encoding="utf-8") as file:
-            raw_prompt = file.read()
-
-        user_prompt = raw_prompt.format_map(placeholders)
+        system_template = load_template("SuperPrompt/analyze_issue_system_prompt.txt")
+        static_placeholders = tuple(sorted((k, v) for k, v in placeholders.items() if k not in ISSUE_PLACEHOLDERS))
+        try:
+            system_prompt = _format_system_prompt(system_template, static_placeholders)
+        except TypeError:
+            # An unhashable value (e.g. a list) cannot key the cache, so format this prompt uncached
+            system_prompt = system_template.format_map(PlaceholderDict(static_placeholders))
+        user_prompt = load_template("SuperPrompt/analyze_issue_user_prompt.txt").format_map(placeholders)
     except FileNotFoundError:
         # For testing: use sample prompts if files don't exist
         system_prompt = (
@@ -6,46 +6,88 @@ across different test modules.
 """
 
 import json
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import MagicMock
 
 import pytest
 
+from my_chat_gpt_utils.analyze_issue import IssueAnalysis
 from my_chat_gpt_utils.openai_utils import OpenAIConfig
 
-# Import project_root to configure Python path
-
 
 class MockOpenAI:
-    """Mock class for OpenAI API interactions."""
+    """
+    Mock class for OpenAI API interactions.
+
+    This is a practical example of how to mock an external API client. Here's how it works:
+
+    1. When we create a mock, we tell it what response to return:
+       mock = MockOpenAI({"issue_type": "Bug Fix", "priority": "High"})
+
+    2. The mock mimics the real OpenAI client's structure:
+       Real client: client.chat.completions.create(...)
+       Our mock:   mock.chat.completions.create(...)
+
+    3. When the code calls create(), our mock returns a fake response that looks like:
+       {
+           "choices": [
+               {
+                   "message": {
+                       "content": '{"issue_type": "Bug Fix", "priority": "High"}'
+                   }
+               }
+           ]
+       }
+
+    This lets us test our code without making real API calls. For example:
+    >>> mock = MockOpenAI({"issue_type": "Bug Fix"})
+    >>> analyzer = LLMIssueAnalyzer(config)
+    >>> analyzer.client = mock  # Use our mock instead of real client
+    >>> result = analyzer.analyze_issue(data)  # This uses our mock, not real API
+    >>> assert result.issue_type == "Bug Fix"  # Test passes!
+    """
 
     def __init__(self, expected_response: Dict[str, Any]):
         """
-        Initialize the mock OpenAI client.
+        Create a mock that will return the given response.
 
         Args:
         ----
-            expected_response: Dictionary containing the expected API response.
+            expected_response: The data we want our mock to return.
+                             This should match what our code expects.
 
         """
         self.expected_response = expected_response
+        self._content = json.dumps(expected_response)
 
-    def create(self, **kwargs):
-        """
-        Create a mock OpenAI API response.
-
-        Args:
-        ----
-            **kwargs: Arbitrary keyword arguments that would be passed to the real API.
+        # Create the nested structure that matches OpenAI's client
+        self.chat = MagicMock()
+        self.chat.completions = MagicMock()
 
-        Returns:
-        -------
-            MagicMock: A mock response object with the expected content.
+        # Tell the mock what to return when create() is called; the response is built once and reused
+        self._cached_response = self._create_mock_response()
+        self.chat.completions.create = MagicMock(return_value=self._cached_response)
 
+    def _create_mock_response(self):
+        """
+        Create a fake response that looks like what OpenAI would return.
+
+        The real OpenAI API returns responses in this format:
+        {
+            "choices": [
+                {
+                    "message": {
+                        "content": "JSON string here"
+                    }
+                }
+            ]
+        }
+
+        The code under test only reads attributes, so plain SimpleNamespace objects are enough:
+        - response.choices[0].message.content = "our JSON string"
         """
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=json.dumps(self.expected_response)))]
-        return mock_response
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self._content))])
 
 
 class MockGitHub:
@@ -113,23 +155,55 @@ class MockGitHub:
         return True
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def disable_llm_disk_cache():
+    """Keep the persistent LLM response cache off even when the shell enables it, so mocked responses never reach disk."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("LLM_CACHE", raising=False)
+        yield
+
+
+@pytest.fixture(scope="session")
 def mock_openai():
     """
     Create a mock OpenAI client fixture.
 
-    Returns
+    The canned response is immutable, so one client is shared across the session;
+    reset_mock_openai_calls clears its call history before every test.
+
+    Returns:
     -------
-        MockOpenAI: A configured mock OpenAI client.
+        MockOpenAI: A mock OpenAI client returning a complete issue analysis.
 
     """
-    expected_response = {
-        "issue_type": "Bug Fix",
-        "priority": "High",
-        "summary": "Test summary",
-        "analysis": "Test analysis",
-    }
-    return MockOpenAI(expected_response)
+    return MockOpenAI(
+        {
+            "issue_type": "Bug Fix",
+            "priority": "High",
+            "complexity": "Moderate",
+            "review_feedback": "Test feedback",
+            "next_steps": ["Step 1", "Step 2"],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_openai_calls(mock_openai):
+    """Clear the calls recorded by the shared mock_openai client, so call assertions never see an earlier test."""
+    mock_openai.chat.completions.create.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def make_mock_openai():
+    """
+    Provide the MockOpenAI factory for tests that need a custom canned response.
+
+    Returns:
+    -------
+        type[MockOpenAI]: Call with the expected response dict to build a client.
+
+    """
+    return MockOpenAI
 
 
 @pytest.fixture
@@ -137,7 +211,9 @@ def mock_github():
     """
     Create a mock GitHub client fixture.
 
-    Returns
+    Function-scoped because the mock records labels and comments per test.
+
+    Returns:
     -------
         MockGitHub: A configured mock GitHub client.
 
@@ -145,38 +221,54 @@ def mock_github():
     return MockGitHub()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_issue_analysis():
+    """
+    Create a sample issue analysis result fixture.
+
+    Returns:
+    -------
+        IssueAnalysis: Analysis matching the mock_openai canned response.
+
+    """
+    return IssueAnalysis(
+        issue_type="Bug Fix",
+        priority="High",
+        complexity="Moderate",
+        review_feedback="Test feedback",
+        next_steps=["Step 1", "Step 2"],
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_issue_data():
     """
     Create mock issue data fixture.
 
-    Returns
+    Returns:
     -------
-        dict: Dictionary containing mock issue data.
+        MappingProxyType: Read-only mapping containing mock issue data.
 
     """
-    return {
-        "repo_owner": "test_owner",
-        "repo_name": "test_repo",
-        "issue_number": 1,
-        "issue_title": "Test Issue",
-        "issue_body": "Test issue body",
-    }
+    return MappingProxyType(
+        {
+            "repo_owner": "test-owner",
+            "repo_name": "test-repo",
+            "issue_number": 123,
+            "title": "Test Issue",
+            "body": "Test body",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai_config():
     """
     Create a mock OpenAI configuration fixture.
 
-    Returns
+    Returns:
     -------
         OpenAIConfig: A configured mock OpenAI configuration.
 
     """
-    return OpenAIConfig(
-        api_key="test-key",
-        model="gpt-3.5-turbo",
-        max_tokens=1000,
-        temperature=0.7,
-    )
+    return OpenAIConfig(api_key="test-key", model="test-model", max_tokens=100, temperature=0.5)
@@ -20,7 +20,7 @@ import pytest
 from my_chat_gpt_utils.github_utils import IssueRetriever, get_github_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_repository():
     """Get a real GitHub repository for integration testing."""
     client = get_github_client(test_mode=True)
@@ -28,6 +28,35 @@ def github_repository():
     return client.get_repo("PyGithub/PyGithub")
 
 
+@pytest.fixture(scope="session")
+def retrieval_time():
+    """Fix the retriever clock for the session, so the cached window and every narrower window share one 'now'."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def all_recent_issues(github_repository, retrieval_time):
+    """Fetch a one year window of issues in all states once per session; the narrower cases replay it."""
+    return IssueRetriever(github_repository, clock=lambda: retrieval_time).get_recent_issues(state="all", days_back=365)
+
+
+class ReplayRepository:
+    """Serve the cached issues through get_issues, applying the state and since filters GitHub applies server-side."""
+
+    def __init__(self, issues):
+        self.issues = issues
+
+    def get_issues(self, state, since, sort, direction):
+        # The cached list is already newest-created first, as sort="created", direction="desc" requests
+        return [issue for issue in self.issues if state in ("all", issue.state) and issue.updated_at >= since]
+
+
+@pytest.fixture
+def replay_retriever(all_recent_issues, retrieval_time):
+    """Provide a real IssueRetriever that reads the session's cached issues instead of the live API."""
+    return IssueRetriever(ReplayRepository(all_recent_issues), clock=lambda: retrieval_time)
+
+
 @pytest.mark.integration
 def test_get_recent_issues_basic(github_repository):
     """Test basic issue retrieval with default parameters."""
@@ -37,30 +66,31 @@ def test_get_recent_issues_basic(github_repository):
 
 
 @pytest.mark.integration
-def test_get_recent_issues_with_state(github_repository):
+@pytest.mark.parametrize("state", ["open", "closed", "all"])
+def test_get_recent_issues_with_state(replay_retriever, all_recent_issues, retrieval_time, state):
     """Test issue retrieval with different state filters."""
-    retriever = IssueRetriever(github_repository)
+    issues = replay_retriever.get_recent_issues(state=state)
+    assert isinstance(issues, list)
+    if state != "all":
+        assert all(issue.state == state for issue in issues)
 
-    # Test with different states
-    for state in ["open", "closed", "all"]:
-        issues = retriever.get_recent_issues(state=state)
-        assert isinstance(issues, list)
+    cutoff_date = retrieval_time - timedelta(days=30)
+    expected = [issue for issue in all_recent_issues if state in ("all", issue.state) and issue.created_at >= cutoff_date]
+    assert [issue.number for issue in issues] == [issue.number for issue in expected]
 
 
 @pytest.mark.integration
-def test_get_recent_issues_with_time_window(github_repository):
+@pytest.mark.parametrize("days", [7, 30, 90, 365])
+def test_get_recent_issues_with_time_window(replay_retriever, all_recent_issues, retrieval_time, days):
     """Test issue retrieval with different time windows."""
-    retriever = IssueRetriever(github_repository)
-
-    # Test with different time windows
-    for days in [7, 30, 90, 365]:
-        issues = retriever.get_recent_issues(days=days)
-        assert isinstance(issues, list)
+    cutoff_date = retrieval_time - timedelta(days=days)
+    issues = replay_retriever.get_recent_issues(days_back=days)
+    assert isinstance(issues, list)
 
-        # Verify issues are within the time window
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        for issue in issues:
-            assert issue.created_at >= cutoff_date
+    # Verify issues are within the time window, and that the retriever stops at the cutoff without dropping any
+    assert all(issue.created_at >= cutoff_date for issue in issues)
+    expected = [issue for issue in all_recent_issues if issue.created_at >= cutoff_date]
+    assert [issue.number for issue in issues] == [issue.number for issue in expected]
 
 
 @pytest.mark.integration
@@ -69,17 +99,14 @@ def test_get_recent_issues_empty_repository(github_repository):
     retriever = IssueRetriever(github_repository)
 
     # Use a very short time window to likely get no issues
-    issues = retriever.get_recent_issues(days=1)
+    issues = retriever.get_recent_issues(days_back=1)
     assert isinstance(issues, list)
     assert len(issues) >= 0  # Should not raise an exception even if empty
 
 
 @pytest.mark.integration
-def test_get_recent_issues_large_time_window(github_repository):
+def test_get_recent_issues_large_time_window(all_recent_issues):
     """Test issue retrieval with a large time window."""
-    retriever = IssueRetriever(github_repository)
-
-    # Test with a large time window (1 year)
-    issues = retriever.get_recent_issues(days=365)
-    assert isinstance(issues, list)
+    # The session fixture already requested a 1 year window
+    assert isinstance(all_recent_issues, list)
     # Don't assert on length since it depends on repository activity
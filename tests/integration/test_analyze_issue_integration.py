@@ -35,7 +35,7 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_issue_data():
     """Fixture providing test issue data for integration tests."""
     return {
@@ -47,7 +47,7 @@ def test_issue_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_openai_config():
     """Fixture providing OpenAI configuration for integration tests."""
     return OpenAIConfig(
@@ -6,14 +6,17 @@ This module contains unit tests for the analyze_issue functionality. These tests
 2. Focus on testing the logic and behavior of the code
 3. Don't make any real API calls or GitHub operations
 
+The shared mocks and fixtures (MockOpenAI, MockGitHub, mock_openai, mock_issue_data, ...) live in tests/conftest.py.
+
 For integration tests that use real GitHub clients, see tests/integration/test_analyze_issue_integration.py
 """
 
 # Test comment for IDE pre-commit hooks
+import hashlib
 import json
-import os
-from typing import Any, Dict
-from unittest.mock import MagicMock, mock_open, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -35,227 +38,51 @@ from my_chat_gpt_utils.openai_utils import (
     DEFAULT_LLM_MODEL,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TEMPERATURE,
-    OpenAIConfig,
+    LLMResponseCache,
+    OpenAIValidator,
+    make_openai_api_call,
 )
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def mock_openai_client():
-    """Automatically mock OpenAI client for all tests."""
-    with patch("openai.OpenAI") as mock_client:
-        mock_client.return_value = MagicMock()
+    """Automatically mock OpenAI client for all tests; installed once per module instead of per test."""
+    mock_client = MagicMock(return_value=MagicMock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("openai.OpenAI", mock_client)
         yield mock_client
 
 
-class MockOpenAI:
-    """
-    Mock class for OpenAI API interactions.
-
-    This is a practical example of how to mock an external API client. Here's how it works:
-
-    1. When we create a mock, we tell it what response to return:
-       mock = MockOpenAI({"issue_type": "Bug Fix", "priority": "High"})
-
-    2. The mock mimics the real OpenAI client's structure:
-       Real client: client.chat.completions.create(...)
-       Our mock:   mock.chat.completions.create(...)
-
-    3. When the code calls create(), our mock returns a fake response that looks like:
-       {
-           "choices": [
-               {
-                   "message": {
-                       "content": '{"issue_type": "Bug Fix", "priority": "High"}'
-                   }
-               }
-           ]
-       }
-
-    This lets us test our code without making real API calls. For example:
-    >>> mock = MockOpenAI({"issue_type": "Bug Fix"})
-    >>> analyzer = LLMIssueAnalyzer(config)
-    >>> analyzer.client = mock  # Use our mock instead of real client
-    >>> result = analyzer.analyze_issue(data)  # This uses our mock, not real API
-    >>> assert result.issue_type == "Bug Fix"  # Test passes!
-    """
-
-    def __init__(self, expected_response: Dict[str, Any]):
-        """
-        Create a mock that will return the given response.
-
-        Args:
-        ----
-            expected_response: The data we want our mock to return.
-                             This should match what our code expects.
-
-        """
-        self.expected_response = expected_response
-
-        # Create the nested structure that matches OpenAI's client
-        self.chat = MagicMock()
-        self.chat.completions = MagicMock()
-
-        # Tell the mock what to return when create() is called
-        self.chat.completions.create = MagicMock(return_value=self._create_mock_response())
-
-    def _create_mock_response(self):
-        """
-        Create a fake response that looks like what OpenAI would return.
-
-        The real OpenAI API returns responses in this format:
-        {
-            "choices": [
-                {
-                    "message": {
-                        "content": "JSON string here"
-                    }
-                }
-            ]
-        }
-
-        We create a similar structure using MagicMock objects:
-        - mock_response.choices[0].message.content = "our JSON string"
-        """
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=json.dumps(self.expected_response)))]
-        return mock_response
-
-
-class MockGitHub:
-    """
-    Mock class for GitHub API interactions.
-
-    This mock simulates GitHub's API by:
-    1. Storing actions (like adding labels or comments) in memory
-    2. Providing methods that match GitHub's API structure
-    3. Allowing us to check what actions were performed
-
-    Example usage:
-    >>> mock_github = MockGitHub()
-    >>> mock_github.add_labels_to_issue("owner", "repo", 123, ["bug", "high"])
-    >>> mock_github.labels  # Check what labels were added
-    ['bug', 'high']
-
-    The mock tracks:
-    - Labels: What labels were created and added to issues
-    - Comments: What comments were posted to issues
-
-    This lets us verify that our code:
-    1. Creates the right labels
-    2. Adds labels to issues
-    3. Posts comments with the right content
-    """
-
-    def __init__(self):
-        """Initialize empty lists to track labels and comments."""
-        self.labels = []  # Track all labels that were created or added
-        self.comments = []  # Track all comments that were posted
-
-    def ensure_labels_exist(self, owner: str, repo: str, labels: list) -> list:
-        """
-        Simulate creating labels in a GitHub repository.
-
-        Args:
-        ----
-            owner: Repository owner (not used in mock)
-            repo: Repository name (not used in mock)
-            labels: List of labels to create
-
-        Returns:
-        -------
-            list: The labels that were created
-
-        """
-        self.labels.extend(labels)  # Track the labels
-        return labels
-
-    def add_labels_to_issue(self, owner: str, repo: str, issue_number: int, labels: list) -> bool:
-        """
-        Simulate adding labels to a GitHub issue.
-
-        Args:
-        ----
-            owner: Repository owner (not used in mock)
-            repo: Repository name (not used in mock)
-            issue_number: Issue number (not used in mock)
-            labels: List of labels to add
-
-        Returns:
-        -------
-            bool: Always True in mock
-
-        """
-        self.labels.extend(labels)  # Track the labels
-        return True
-
-    def append_response_to_issue(self, client, repo_name: str, issue_data: Dict[str, Any], comment: str) -> bool:
-        """
-        Simulate posting a comment to a GitHub issue.
-
-        Args:
-        ----
-            client: GitHub client (not used in mock)
-            repo_name: Repository name (not used in mock)
-            issue_data: Issue data (not used in mock)
-            comment: The comment text to post
-
-        Returns:
-        -------
-            bool: Always True in mock
-
-        """
-        self.comments.append(comment)  # Track the comment
-        return True
-
-
 @pytest.fixture
-def mock_openai():
-    """Fixture providing a mock OpenAI API client."""
-    return MockOpenAI(
-        {
-            "issue_type": "Bug Fix",
-            "priority": "High",
-            "complexity": "Moderate",
-            "review_feedback": "Test feedback",
-            "next_steps": ["Step 1", "Step 2"],
-        }
-    )
+def issue_env(monkeypatch):
+    """Clear the issue-data environment variables; returns monkeypatch for per-test overrides."""
+    for name in ("ISSUE_DATA", "GITHUB_EVENT_PATH"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
 
 
 @pytest.fixture
-def mock_github():
-    """Fixture providing a mock GitHub API client."""
-    return MockGitHub()
-
-
-@pytest.fixture
-def mock_issue_analysis():
-    """Fixture providing a sample issue analysis result."""
-    return IssueAnalysis(
-        issue_type="Bug Fix",
-        priority="High",
-        complexity="Moderate",
-        review_feedback="Test feedback",
-        next_steps=["Step 1", "Step 2"],
+def openai_env(monkeypatch):
+    """Clear the OpenAI environment variables and stub the version and API-key checks to pass."""
+    for name in ("OPENAI_API_KEY", "LLM_MODEL", "MAX_TOKENS", "TEMPERATURE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(
+        "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
+        lambda *args, **kwargs: True,
     )
+    monkeypatch.setattr(
+        "my_chat_gpt_utils.analyze_issue.OpenAIValidator.validate_api_key",
+        lambda *args, **kwargs: True,
+    )
+    return monkeypatch
 
 
-@pytest.fixture
-def mock_issue_data():
-    """Fixture providing sample issue data."""
-    return {
-        "repo_owner": "test-owner",
-        "repo_name": "test-repo",
-        "issue_number": 123,
-        "title": "Test Issue",
-        "body": "Test body",
-    }
-
-
-@pytest.fixture
-def mock_openai_config():
-    """Fixture providing OpenAI configuration."""
-    return OpenAIConfig(api_key="test-key", model="test-model", max_tokens=100, temperature=0.5)
+OPENAI_TEST_ENV = {
+    "OPENAI_API_KEY": "test-key",
+    "LLM_MODEL": "test-model",
+    "MAX_TOKENS": "100",
+    "TEMPERATURE": "0.5",
+}
 
 
 def test_analyze_issue(mock_openai, mock_issue_data, mock_openai_config):
@@ -289,6 +116,26 @@ def test_analyze_issue(mock_openai, mock_issue_data, mock_openai_config):
     assert analysis.next_steps == ["Step 1", "Step 2"]
 
 
+@pytest.mark.benchmark(group="analyze_issue")
+def test_analyze_issue_benchmark(benchmark, mock_openai, mock_issue_data, mock_openai_config):
+    """Track the cost of the analyze_issue path (prompt build, JSON parse, validation) against the mock client."""
+    analyzer = LLMIssueAnalyzer(mock_openai_config)
+    analyzer.client = mock_openai
+    # Empty the response cache before every round, so each one takes the full request path
+    analysis = benchmark.pedantic(analyzer.analyze_issue, args=(mock_issue_data,), setup=analyzer._response_cache.clear, rounds=200)
+    assert analysis.issue_type == "Bug Fix"
+
+
+@pytest.mark.benchmark(group="analyze_issue")
+def test_analyze_issue_cache_hit_benchmark(benchmark, mock_openai, mock_issue_data, mock_openai_config):
+    """Track the cost of analyze_issue when an identical prompt is served from the response cache."""
+    analyzer = LLMIssueAnalyzer(mock_openai_config)
+    analyzer.client = mock_openai
+    analyzer.analyze_issue(mock_issue_data)
+    analysis = benchmark(analyzer.analyze_issue, mock_issue_data)
+    assert analysis.issue_type == "Bug Fix"
+
+
 def test_analyze_issue_mock_llm_skips_openai_api(mock_issue_data, mock_openai_config, monkeypatch):
     """ISSUE_ANALYZER_MOCK_LLM returns canned analysis and does not call the OpenAI client."""
 
@@ -316,9 +163,74 @@ def test_is_issue_analyzer_mock_llm_truthy(monkeypatch):
     assert is_issue_analyzer_mock_llm() is False
 
 
-def test_analyze_issue_normalizes_literal_backslash_n_from_llm_json(mock_issue_data, mock_openai_config):
+def test_analyze_issue_reuses_response_for_identical_issue(make_mock_openai, mock_issue_data, mock_openai_config):
+    """Analyzing the same issue twice sends one OpenAI request; a different issue sends another."""
+    mock_openai = make_mock_openai(
+        {"issue_type": "Task", "priority": "Low", "complexity": "Simple", "review_feedback": "", "next_steps": []}
+    )
+    analyzer = LLMIssueAnalyzer(mock_openai_config)
+    analyzer.client = mock_openai
+
+    first = analyzer.analyze_issue(mock_issue_data)
+    second = analyzer.analyze_issue(dict(mock_issue_data))
+    assert mock_openai.chat.completions.create.call_count == 1
+    assert first == second
+    assert first is not second
+
+    analyzer.analyze_issue({**mock_issue_data, "title": "Another issue"})
+    assert mock_openai.chat.completions.create.call_count == 2
+
+
+def test_llm_disk_cache_is_opt_in(monkeypatch, tmp_path):
+    """The disk cache stays off unless LLM_CACHE explicitly enables it."""
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    assert LLMResponseCache.from_env() is None
+
+    monkeypatch.setenv("LLM_CACHE", "0")
+    assert LLMResponseCache.from_env() is None
+
+    monkeypatch.setenv("LLM_CACHE", "yes")
+    assert LLMResponseCache.from_env().directory == tmp_path
+
+
+def test_analyze_issue_reuses_response_from_disk_cache(
+    make_mock_openai, mock_issue_data, mock_openai_config, monkeypatch, tmp_path
+):
+    """A new analyzer reuses a response another analyzer stored in the disk cache."""
+    monkeypatch.setenv("LLM_CACHE", "1")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    payload = {"issue_type": "Task", "priority": "Low", "complexity": "Simple", "review_feedback": "", "next_steps": []}
+
+    first_client = make_mock_openai(payload)
+    first = LLMIssueAnalyzer(mock_openai_config)
+    first.client = first_client
+    first.analyze_issue(mock_issue_data)
+
+    second_client = make_mock_openai(payload)
+    second = LLMIssueAnalyzer(mock_openai_config)
+    second.client = second_client
+    analysis = second.analyze_issue(mock_issue_data)
+
+    assert first_client.chat.completions.create.call_count == 1
+    second_client.chat.completions.create.assert_not_called()
+    assert analysis.issue_type == "Task"
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_response_cache_stays_bounded_across_threads(mock_openai_config, monkeypatch):
+    """Concurrent inserts never grow the response cache past its size or evict the same entry twice."""
+    monkeypatch.setattr(LLMIssueAnalyzer, "response_cache_size", 8)
+    analyzer = LLMIssueAnalyzer(mock_openai_config)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: analyzer._cache_content(f"key-{i}", "{}"), range(2000)))
+
+    assert len(analyzer._response_cache) == 8
+
+
+def test_analyze_issue_normalizes_literal_backslash_n_from_llm_json(make_mock_openai, mock_issue_data, mock_openai_config):
     """When json.loads leaves literal \\n in strings, normalize to real newlines (GitHub comment fix)."""
-    mock_openai = MockOpenAI(
+    mock_openai = make_mock_openai(
         {
             "issue_type": "Bug Fix",
             "priority": "High",
@@ -335,12 +247,16 @@ def test_analyze_issue_normalizes_literal_backslash_n_from_llm_json(mock_issue_d
     assert "\\n" not in analysis.review_feedback
 
 
-def test_get_required_labels():
+@pytest.fixture(scope="session")
+def required_labels():
+    """Compute the required GitHub labels once for all membership checks."""
+    return get_required_labels()
+
+
+@pytest.mark.parametrize("label", ["Type: Bug Fix", "Priority: High", "Complexity: Simple"])
+def test_get_required_labels(required_labels, label):
     """Test retrieval of required GitHub labels."""
-    labels = get_required_labels()
-    assert "Type: Bug Fix" in labels
-    assert "Priority: High" in labels
-    assert "Complexity: Simple" in labels
+    assert label in required_labels
 
 
 def test_get_issue_specific_labels(mock_issue_analysis):
@@ -390,7 +306,7 @@ def test_create_analysis_comment_multiline_review_not_literal_backslash_n():
     assert "\\n" not in review_block
 
 
-def test_process_issue_analysis():
+def test_process_issue_analysis(mocker):
     """
     Test process_issue_analysis function.
 
@@ -420,8 +336,7 @@ def test_process_issue_analysis():
     mock_client = MagicMock()
     mock_repo = MagicMock()
     mock_issue = MagicMock()
-    mock_user = MagicMock()
-    mock_user.login = "test_user"
+    mock_user = SimpleNamespace(login="test_user")
 
     # Set up the mock chain
     mock_client.get_user.return_value = mock_user
@@ -429,219 +344,194 @@ def test_process_issue_analysis():
     mock_repo.get_issue.return_value = mock_issue
     mock_issue.create_comment.return_value = MagicMock()
 
-    # Mock the GitHub client
-    with patch("my_chat_gpt_utils.analyze_issue.get_github_client", return_value=mock_client):
-        # Mock the label manager
-        mock_label_manager = MagicMock()
-        mock_label_manager.ensure_labels_exist.return_value = True
-        mock_label_manager.add_labels_to_issue.return_value = True
-        with patch(
-            "my_chat_gpt_utils.analyze_issue.GitHubLabelManager",
-            return_value=mock_label_manager,
-        ):
-            # Mock the analyzer response
-            mock_analyzer = MagicMock()
-            mock_analyzer.analyze_issue.return_value = IssueAnalysis(
-                issue_type="Bug Fix",
-                priority="High",
-                complexity="Moderate",
-                review_feedback="Test feedback",
-                next_steps=["Step 1", "Step 2"],
-            )
-            with patch(
-                "my_chat_gpt_utils.analyze_issue.LLMIssueAnalyzer",
-                return_value=mock_analyzer,
-            ):
-                # Run the analysis
-                result = process_issue_analysis(mock_issue_data, mock_openai_config, test_mode=True)
-
-                # Verify the result
-                assert isinstance(result, IssueAnalysis)
-                assert result.issue_type == "Bug Fix"
-                assert result.priority == "High"
-                assert result.complexity == "Moderate"
-                assert result.review_feedback == "Test feedback"
-                assert result.next_steps == ["Step 1", "Step 2"]
-
-                # Verify GitHub client interactions
-                mock_client.get_repo.assert_called_once_with("test_owner/test_repo")
-                mock_repo.get_issue.assert_called_once_with(number=1)
-                mock_issue.create_comment.assert_called_once()
-
-                # Verify label manager interactions
-                mock_label_manager.ensure_labels_exist.assert_called_once()
-                mock_label_manager.add_labels_to_issue.assert_called_once()
-
-                # Verify analyzer interactions
-                mock_analyzer.analyze_issue.assert_called_once()
-
-
-def test_get_issue_data_with_provided_data(mock_issue_data):
-    """Test getting issue data when provided directly."""
-    result = get_issue_data(mock_issue_data)
-    assert result == mock_issue_data
-
-
-def test_get_issue_data_from_env():
-    """Test getting issue data from environment variable."""
-    test_data = {"title": "Test Issue", "body": "Test Body"}
-    with patch.dict("os.environ", {"ISSUE_DATA": json.dumps(test_data)}):
-        result = get_issue_data()
-        assert result == test_data
-
-
-def test_get_issue_data_from_event_file():
-    """Test getting issue data from event file."""
-    test_data = {"issue": {"title": "Test Issue", "body": "Test Body"}}
-    with (
-        patch("os.path.exists", return_value=True),
-        patch("builtins.open", mock_open(read_data=json.dumps(test_data))),
-    ):
-        with patch.dict("os.environ", {"GITHUB_EVENT_PATH": "test_path"}):
-            result = get_issue_data()
-            assert result == test_data["issue"]
-
-
-def test_get_issue_data_event_file_error():
-    """Test handling of event file reading error."""
-    with (
-        patch("os.path.exists", return_value=True),
-        patch("builtins.open", side_effect=IOError("File error")),
-    ):
-        with patch.dict("os.environ", {"GITHUB_EVENT_PATH": "test_path"}):
-            result = get_issue_data()
-            assert result == {}
-
-
-def test_get_issue_data_empty_env():
-    """Test getting issue data with empty environment."""
-    with patch.dict("os.environ", {}, clear=True):
-        result = get_issue_data()
-        assert result == {}
-
-
-def test_get_issue_data_provided_data():
-    """Test getting issue data from provided data."""
-    test_data = {"title": "Test Issue", "body": "Test Body"}
-    result = get_issue_data(test_data)
-    assert result == test_data
-
-
-def test_get_issue_data_invalid_json():
-    """Test handling of invalid JSON in environment variable."""
-    with patch.dict("os.environ", {"ISSUE_DATA": "invalid json"}):
-        result = get_issue_data()
-        assert result == {}
-
-
-def test_setup_openai_config_success():
-    """Test successful OpenAI configuration setup."""
-    with (
-        patch.dict(
-            "os.environ",
-            {
-                "OPENAI_API_KEY": "test-key",
-                "LLM_MODEL": "test-model",
-                "MAX_TOKENS": "100",
-                "TEMPERATURE": "0.5",
-            },
-        ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
-            return_value=True,
-        ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIValidator.validate_api_key",
-            return_value=True,
-        ),
-    ):
-        config = setup_openai_config()
-        assert config.api_key == "test-key"
-        assert config.model == "test-model"
-        assert config.max_tokens == 100
-        assert config.temperature == 0.5
-
-
-def test_setup_openai_config_invalid_version():
-    """Test OpenAI configuration setup with invalid library version."""
-    with (
-        patch.dict(
-            "os.environ",
-            {
-                "OPENAI_API_KEY": "test-key",
-                "LLM_MODEL": "test-model",
-                "MAX_TOKENS": "100",
-                "TEMPERATURE": "0.5",
-            },
-        ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
-            return_value=False,
-        ),
-    ):
-        with pytest.raises(RuntimeError, match="Incompatible OpenAI library version"):
-            setup_openai_config()
+    # Mock the label manager
+    mock_label_manager = MagicMock()
+    mock_label_manager.ensure_labels_exist.return_value = True
+    mock_label_manager.add_labels_to_issue.return_value = True
 
+    # Mock the analyzer response
+    mock_analyzer = MagicMock()
+    mock_analyzer.analyze_issue.return_value = IssueAnalysis(
+        issue_type="Bug Fix",
+        priority="High",
+        complexity="Moderate",
+        review_feedback="Test feedback",
+        next_steps=["Step 1", "Step 2"],
+    )
 
-def test_setup_openai_config_invalid_api_key():
-    """Test OpenAI configuration setup with invalid API key."""
-    with (
-        patch.dict(
-            "os.environ",
-            {
-                "OPENAI_API_KEY": "test-key",
-                "LLM_MODEL": "test-model",
-                "MAX_TOKENS": "100",
-                "TEMPERATURE": "0.5",
-            },
+    # Patches are registered with pytest's finalizers and undone after the test
+    mocker.patch("my_chat_gpt_utils.analyze_issue.get_github_client", return_value=mock_client)
+    mocker.patch("my_chat_gpt_utils.analyze_issue.GitHubLabelManager", return_value=mock_label_manager)
+    mocker.patch("my_chat_gpt_utils.analyze_issue.LLMIssueAnalyzer", return_value=mock_analyzer)
+
+    # Run the analysis
+    result = process_issue_analysis(mock_issue_data, mock_openai_config, test_mode=True)
+
+    # Verify the result
+    assert isinstance(result, IssueAnalysis)
+    assert result.issue_type == "Bug Fix"
+    assert result.priority == "High"
+    assert result.complexity == "Moderate"
+    assert result.review_feedback == "Test feedback"
+    assert result.next_steps == ["Step 1", "Step 2"]
+
+    # Verify GitHub client interactions
+    mock_client.get_repo.assert_called_once_with("test_owner/test_repo")
+    mock_repo.get_issue.assert_called_once_with(number=1)
+    mock_issue.create_comment.assert_called_once()
+
+    # Verify label manager interactions
+    mock_label_manager.ensure_labels_exist.assert_called_once()
+    mock_label_manager.add_labels_to_issue.assert_called_once()
+
+    # Verify analyzer interactions
+    mock_analyzer.analyze_issue.assert_called_once()
+
+
+ISSUE_FIELDS = {"title": "Test Issue", "body": "Test Body"}
+
+
+@pytest.mark.parametrize(
+    ("env", "event_file", "provided", "expected"),
+    [
+        pytest.param({}, None, ISSUE_FIELDS, ISSUE_FIELDS, id="provided-data"),
+        pytest.param({"ISSUE_DATA": json.dumps(ISSUE_FIELDS)}, None, None, ISSUE_FIELDS, id="issue-data-env"),
+        pytest.param({"ISSUE_DATA": "invalid json"}, None, None, {}, id="issue-data-invalid-json"),
+        pytest.param({}, json.dumps({"issue": ISSUE_FIELDS}), None, ISSUE_FIELDS, id="event-file"),
+        pytest.param({}, "invalid json", None, {}, id="event-file-invalid-json"),
+        pytest.param({"GITHUB_EVENT_PATH": "missing-event.json"}, None, None, {}, id="event-file-missing"),
+        pytest.param({}, None, None, {}, id="empty-env"),
+    ],
+)
+def test_get_issue_data(issue_env, tmp_path, env, event_file, provided, expected):
+    """Test get_issue_data precedence: provided data, then ISSUE_DATA, then the GitHub event file."""
+    for name, value in env.items():
+        issue_env.setenv(name, value)
+    if event_file is not None:
+        event_path = tmp_path / "event.json"
+        event_path.write_text(event_file, encoding="utf-8")
+        issue_env.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    assert get_issue_data(provided) == expected
+
+
+def test_get_issue_data_event_file_error(issue_env, tmp_path):
+    """Test handling of an event path that exists but cannot be read as a file."""
+    issue_env.setenv("GITHUB_EVENT_PATH", str(tmp_path))
+    assert get_issue_data() == {}
+
+
+@pytest.mark.parametrize(
+    ("env", "version_ok", "key_ok", "expected"),
+    [
+        pytest.param(OPENAI_TEST_ENV, True, True, ("test-key", "test-model", 100, 0.5), id="success"),
+        pytest.param(
+            {},
+            True,
+            True,
+            ("", DEFAULT_LLM_MODEL, DEFAULT_MAX_TOKENS, DEFAULT_TEMPERATURE),
+            id="default-values",
         ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
-            return_value=True,
+        pytest.param(
+            OPENAI_TEST_ENV,
+            False,
+            True,
+            pytest.raises(RuntimeError, match="Incompatible OpenAI library version"),
+            id="invalid-version",
         ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIValidator.validate_api_key",
-            return_value=False,
+        pytest.param(
+            OPENAI_TEST_ENV,
+            True,
+            False,
+            pytest.raises(ValueError, match="Invalid OpenAI API key"),
+            id="invalid-api-key",
         ),
-    ):
-        with pytest.raises(ValueError, match="Invalid OpenAI API key"):
+    ],
+)
+def test_setup_openai_config(openai_env, env, version_ok, key_ok, expected):
+    """Test OpenAI configuration setup from the environment, including version and API-key failures."""
+    for name, value in env.items():
+        openai_env.setenv(name, value)
+    openai_env.setattr(
+        "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
+        lambda *args, **kwargs: version_ok,
+    )
+    openai_env.setattr(
+        "my_chat_gpt_utils.analyze_issue.OpenAIValidator.validate_api_key",
+        lambda *args, **kwargs: key_ok,
+    )
+
+    if not isinstance(expected, tuple):
+        with expected:
             setup_openai_config()
+        return
 
+    config = setup_openai_config()
+    assert (config.api_key, config.model, config.max_tokens, config.temperature) == expected
 
-def test_setup_openai_config_default_values():
-    """Test OpenAI configuration setup with default values."""
-    with (
-        patch.dict("os.environ", {}, clear=True),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIVersionChecker.check_library_version",
-            return_value=True,
-        ),
-        patch(
-            "my_chat_gpt_utils.analyze_issue.OpenAIValidator.validate_api_key",
-            return_value=True,
-        ),
-    ):
-        config = setup_openai_config()
-        assert config.api_key == ""
-        assert config.model == DEFAULT_LLM_MODEL
-        assert config.max_tokens == DEFAULT_MAX_TOKENS
-        assert config.temperature == DEFAULT_TEMPERATURE
+
+def test_make_openai_api_call_accepts_api_key_or_client(monkeypatch):
+    """An API key still works and reuses one client per key; an explicit client is used as given."""
+
+    def client_replying(content):
+        response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=MagicMock(return_value=response))))
+
+    client_class = MagicMock(return_value=client_replying("  keyed reply  "))
+    monkeypatch.setattr("my_chat_gpt_utils.openai_utils.OpenAI", client_class)
+    # A fresh client cache, restored afterwards, so no later caller gets the mocked client
+    clients = {}
+    monkeypatch.setattr("my_chat_gpt_utils.openai_utils._clients", clients)
+    messages = [{"role": "user", "content": "Hi"}]
+    assert make_openai_api_call("test-key", "test-model", messages, 0.1, 10) == "keyed reply"
+    assert make_openai_api_call("test-key", "test-model", messages, 0.1, 10) == "keyed reply"
+    client_class.assert_called_once_with(api_key="test-key")
+    # The cache is keyed by a hash, so the raw key is not held as a cache key
+    assert list(clients) == [hashlib.sha256(b"test-key").hexdigest()]
+
+    explicit = client_replying("explicit reply")
+    assert make_openai_api_call(None, "test-model", messages, 0.1, 10, client=explicit) == "explicit reply"
+    assert client_class.call_count == 1
+
+
+def test_validate_api_key_caches_result(monkeypatch):
+    """Test that a key is validated once over the shared session and then served from the cache."""
+    monkeypatch.setattr(OpenAIValidator, "_cache", {})
+    mock_get = MagicMock(return_value=SimpleNamespace(status_code=200))
+    monkeypatch.setattr(OpenAIValidator, "_session", SimpleNamespace(get=mock_get))
+
+    assert OpenAIValidator.validate_api_key("test-key") is True
+    assert OpenAIValidator.validate_api_key("test-key") is True
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args.kwargs["timeout"] == 5
+    assert "test-key" not in OpenAIValidator._cache
 
 
 def test_analyze_issue_error_handling(mock_issue_data, mock_openai_config):
     """Test error handling in analyze_issue method."""
     analyzer = LLMIssueAnalyzer(mock_openai_config)
-    mock_client = MagicMock()
-    mock_client.chat = MagicMock()
-    mock_client.chat.completions = MagicMock()
-    mock_client.chat.completions.create = MagicMock(side_effect=Exception("API Error"))
-    analyzer.client = mock_client
+    failing_create = MagicMock(side_effect=Exception("API Error"))
+    analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=failing_create)))
     with pytest.raises(Exception) as exc_info:
         analyzer.analyze_issue(mock_issue_data)
     assert "API Error" in str(exc_info.value)
 
 
-def test_get_github_client():
+@pytest.mark.parametrize(
+    ("test_mode", "github_token", "create_error"),
+    [
+        pytest.param(True, None, None, id="test-mode"),
+        pytest.param(False, "test_token", None, id="real-mode-with-token"),
+        pytest.param(
+            False,
+            None,
+            ValueError("GITHUB_TOKEN not found in environment variables"),
+            id="real-mode-without-token",
+        ),
+    ],
+)
+def test_get_github_client(monkeypatch, test_mode, github_token, create_error):
     """
     Test GitHub client creation and configuration.
 
@@ -650,42 +540,26 @@ def test_get_github_client():
     2. The client is configured with the right parameters
     3. Error handling works as expected
     """
-    # Test with test mode
-    with patch("my_chat_gpt_utils.github_utils.GithubClientFactory") as mock_factory:
-        mock_client = MagicMock()
-        mock_factory.create_client.return_value = mock_client
-
-        client = get_github_client(test_mode=True)
-        # Verify the factory was called with correct parameters
-        mock_factory.create_client.assert_called_once_with(test_mode=True)
-        # Verify the client is properly configured
-        assert client is not None
-        assert isinstance(client, MagicMock)
-        # Verify the client has the expected methods
-        assert hasattr(client, "get_repo")
-        assert hasattr(client, "get_user")
-
-    # Test with real mode and token
-    with patch("my_chat_gpt_utils.github_utils.GithubClientFactory") as mock_factory:
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "test_token"}):
-            mock_client = MagicMock()
-            mock_factory.create_client.return_value = mock_client
-
-            client = get_github_client(test_mode=False)
-            # Verify the factory was called with correct parameters
-            mock_factory.create_client.assert_called_once_with(test_mode=False)
-            # Verify the client is properly configured
-            assert client is not None
-            assert isinstance(client, MagicMock)
-            # Verify the client has the expected methods
-            assert hasattr(client, "get_repo")
-            assert hasattr(client, "get_user")
-
-    # Test with real mode but no token
-    with patch("my_chat_gpt_utils.github_utils.GithubClientFactory") as mock_factory:
-        with patch.dict(os.environ, {}, clear=True):
-            mock_factory.create_client.side_effect = ValueError("GITHUB_TOKEN not found in environment variables")
-            with pytest.raises(ValueError, match="GITHUB_TOKEN not found in environment variables"):
-                get_github_client(test_mode=False)
-            # Verify the factory was called
-            mock_factory.create_client.assert_called_once_with(test_mode=False)
+    mock_factory = MagicMock()
+    monkeypatch.setattr("my_chat_gpt_utils.github_utils.GithubClientFactory", mock_factory)
+    if github_token:
+        monkeypatch.setenv("GITHUB_TOKEN", github_token)
+    else:
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+    if create_error is not None:
+        mock_factory.create_client.side_effect = create_error
+        with pytest.raises(ValueError, match="GITHUB_TOKEN not found in environment variables"):
+            get_github_client(test_mode=test_mode)
+        # Verify the factory was called
+        mock_factory.create_client.assert_called_once_with(test_mode=test_mode)
+        return
+
+    mock_client = MagicMock()
+    mock_factory.create_client.return_value = mock_client
+
+    client = get_github_client(test_mode=test_mode)
+    # Verify the factory was called with correct parameters
+    mock_factory.create_client.assert_called_once_with(test_mode=test_mode)
+    # Verify the factory's client is returned unchanged
+    assert client is mock_client
@@ -9,7 +9,7 @@ appending functionality.
 import unittest
 from unittest.mock import MagicMock, patch
 
-from my_chat_gpt_utils.github_utils import append_response_to_issue, get_github_issue
+from my_chat_gpt_utils.github_utils import append_response_to_issue, edit_issue, get_github_issue
 
 
 class TestGitHubUtils(unittest.TestCase):
@@ -65,6 +65,22 @@ class TestGitHubUtils(unittest.TestCase):
         mock_get_github_issue.assert_called_once_with(client, repo_name, issue_data)
         mock_add_comment.assert_called_once_with(mock_issue, f"## OpenAI API Response\n\n{response}")
 
+    def test_edit_issue_single_request(self):
+        """
+        Test the edit_issue function.
+
+        This test verifies that all given fields are sent in one edit call,
+        and that no call is made when there is nothing to change.
+        """
+        mock_issue = MagicMock()
+
+        edit_issue(mock_issue, title="New title", state="closed", labels=["bug"])
+        mock_issue.edit.assert_called_once_with(title="New title", state="closed", labels=["bug"])
+
+        mock_issue.edit.reset_mock()
+        edit_issue(mock_issue)
+        mock_issue.edit.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
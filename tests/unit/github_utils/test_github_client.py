@@ -19,7 +19,6 @@ The tests ensure that the GitHub client provides the necessary functionality
 for the application while handling various error conditions appropriately.
 """
 
-import os
 from unittest.mock import patch
 
 import pytest
@@ -29,125 +28,100 @@ from my_chat_gpt_utils.exceptions import GithubAuthenticationError, ProblemCause
 from my_chat_gpt_utils.github_utils import GithubClientFactory
 
 
-def detect_test_environment():
-    """Detect the current test environment."""
-    if os.getenv("GITHUB_ACTIONS"):
-        return "github_actions"
-    elif os.getenv("CI"):
-        return "ci"
-    else:
-        return "local"
-
-
-@pytest.fixture(scope="session")
-def test_environment():
-    """Configure test environment based on context."""
-    env_type = detect_test_environment()
-    if env_type == "local":
-        # Load .env file for local development
-        from dotenv import load_dotenv
-
-        load_dotenv()
-    return env_type
-
-
-@pytest.fixture
-def github_client(test_environment):
-    """Create a GitHub client with appropriate configuration."""
-    if test_environment in ["github_actions", "ci"]:
-        # Use environment variables in CI/CD
-        token = os.getenv("GITHUB_TOKEN")
-        if not token:
-            pytest.skip("GITHUB_TOKEN not available in CI environment")
-    else:
-        # Use .env file in local development
-        token = os.getenv("GITHUB_TOKEN")
-        if not token:
-            pytest.skip("GITHUB_TOKEN not available in local environment")
-
-    return GithubClientFactory.create_client()
-
-
-def test_github_client_authentication():
-    """Test GitHub client authentication and basic functionality."""
-    # Test with valid token
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.return_value = "test_user"
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "valid-token"}, clear=True):
-            client = GithubClientFactory.create_client()
-            assert client is not None
-            assert client.get_user() == "test_user"
-
-    # Test with invalid token
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.side_effect = GithubException(401, {"message": "Bad credentials"})
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "invalid-token"}, clear=True):
-            with pytest.raises(GithubAuthenticationError) as exc_info:
-                GithubClientFactory.create_client()
-            assert "Invalid or expired GitHub token" in str(exc_info.value)
-
-
-def test_github_client_environment_handling():
-    """Test environment variable handling."""
-    # Test with token in environment
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.return_value = "test_user"
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"}, clear=True):
-            client = GithubClientFactory.create_client()
-            assert client is not None
-
-    # Test with token provided directly
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.return_value = "test_user"
-        client = GithubClientFactory.create_client(token="test-token")
-        assert client is not None
-
-
-def test_github_client_repository_access():
-    """Test repository access and validation."""
-    # Test with valid repository
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_repo = mock_github.return_value.get_repo.return_value
-        mock_repo.get_issues.return_value = []
-
-        with patch.dict(os.environ, {"GITHUB_REPOSITORY": "owner/repo", "GITHUB_TOKEN": "test-token"}, clear=True):
-            client = GithubClientFactory.create_client()
-            repo = GithubClientFactory.get_repository(client)
-            assert repo is not None
-            assert hasattr(repo, "get_issues")
-
-    # Test with invalid repository
+@pytest.fixture(autouse=True)
+def mocked_github():
+    """Patch the Github class used by the client factory once per test and yield the mock."""
     with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_repo.side_effect = GithubException(404, {"message": "Not Found"})
-        with patch.dict(os.environ, {"GITHUB_REPOSITORY": "owner/invalid-repo", "GITHUB_TOKEN": "test-token"}, clear=True):
-            with pytest.raises(ProblemCauseSolution) as exc_info:
-                client = GithubClientFactory.create_client()
-                GithubClientFactory.get_repository(client)
-            assert "Repository not found" in str(exc_info.value)
+        yield mock_github
 
 
-def test_github_client_test_mode():
+@pytest.fixture
+def github_env(monkeypatch):
+    """Clear the GitHub environment variables; returns monkeypatch for per-test overrides."""
+    for name in ("GITHUB_TOKEN", "GITHUB_REPOSITORY", "CI", "GITHUB_ACTIONS"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        pytest.param({"GITHUB_TOKEN": "valid-token"}, id="local"),
+        pytest.param({"GITHUB_TOKEN": "valid-token", "CI": "true"}, id="ci"),
+        pytest.param({"GITHUB_TOKEN": "valid-token", "GITHUB_ACTIONS": "true"}, id="github-actions"),
+    ],
+)
+def test_github_client_valid_token(mocked_github, github_env, env):
+    """Test that a token from the environment authenticates in every execution context."""
+    for name, value in env.items():
+        github_env.setenv(name, value)
+    mocked_github.return_value.get_user.return_value = "test_user"
+
+    client = GithubClientFactory.create_client()
+
+    mocked_github.assert_called_once_with("valid-token")
+    assert client.get_user() == "test_user"
+
+
+def test_github_client_authentication(mocked_github, github_env):
+    """Test GitHub client authentication with an invalid token."""
+    mocked_github.return_value.get_user.side_effect = GithubException(401, {"message": "Bad credentials"})
+    github_env.setenv("GITHUB_TOKEN", "invalid-token")
+    with pytest.raises(GithubAuthenticationError) as exc_info:
+        GithubClientFactory.create_client()
+    assert "Invalid or expired GitHub token" in str(exc_info.value)
+
+
+def test_github_client_environment_handling(mocked_github):
+    """Test that a token passed directly is used without the environment."""
+    mocked_github.return_value.get_user.return_value = "test_user"
+    client = GithubClientFactory.create_client(token="test-token")
+    assert client is not None
+    mocked_github.assert_called_once_with("test-token")
+
+
+def test_github_client_repository_access(mocked_github, github_env):
+    """Test repository access with a valid repository."""
+    mock_repo = mocked_github.return_value.get_repo.return_value
+    mock_repo.get_issues.return_value = []
+    github_env.setenv("GITHUB_REPOSITORY", "owner/repo")
+    github_env.setenv("GITHUB_TOKEN", "test-token")
+
+    client = GithubClientFactory.create_client()
+    repo = GithubClientFactory.get_repository(client)
+    assert repo is mock_repo
+
+
+def test_github_client_repository_not_found(mocked_github, github_env):
+    """Test repository access with an invalid repository."""
+    mocked_github.return_value.get_repo.side_effect = GithubException(404, {"message": "Not Found"})
+    github_env.setenv("GITHUB_REPOSITORY", "owner/invalid-repo")
+    github_env.setenv("GITHUB_TOKEN", "test-token")
+    with pytest.raises(ProblemCauseSolution) as exc_info:
+        client = GithubClientFactory.create_client()
+        GithubClientFactory.get_repository(client)
+    assert "Repository not found" in str(exc_info.value)
+
+
+def test_github_client_test_mode(mocked_github):
     """Test client behavior in test mode."""
     # Test mode should skip validation
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.side_effect = GithubException(401, {"message": "Bad credentials"})
-        client = GithubClientFactory.create_client(test_mode=True)
-        assert client is not None
+    mocked_github.return_value.get_user.side_effect = GithubException(401, {"message": "Bad credentials"})
+    client = GithubClientFactory.create_client(test_mode=True)
+    assert client is not None
 
 
-def test_github_client_error_handling():
-    """Test error handling in GitHub client operations."""
-    # Test missing token
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ProblemCauseSolution) as exc_info:
-                GithubClientFactory.create_client()
-            assert "GitHub token not found" in str(exc_info.value)
+def test_github_client_missing_token(github_env):
+    """Test error handling when no token is available."""
+    with pytest.raises(ProblemCauseSolution) as exc_info:
+        GithubClientFactory.create_client()
+    assert "GitHub token not found" in str(exc_info.value)
 
-    # Test rate limit error
-    with patch("my_chat_gpt_utils.github_utils.Github") as mock_github:
-        mock_github.return_value.get_user.side_effect = RateLimitExceededException(403, {"message": "API rate limit exceeded"})
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"}, clear=True):
-            with pytest.raises(ProblemCauseSolution) as exc_info:
-                GithubClientFactory.create_client(test_mode=False)
-            assert "GitHub API rate limit exceeded" in str(exc_info.value)
+
+def test_github_client_rate_limit(mocked_github, github_env):
+    """Test error handling when the GitHub API rate limit is exceeded."""
+    mocked_github.return_value.get_user.side_effect = RateLimitExceededException(403, {"message": "API rate limit exceeded"})
+    github_env.setenv("GITHUB_TOKEN", "test-token")
+    with pytest.raises(ProblemCauseSolution) as exc_info:
+        GithubClientFactory.create_client(test_mode=False)
+    assert "GitHub API rate limit exceeded" in str(exc_info.value)
@@ -18,6 +18,7 @@ This ensures we only process relevant issues and don't waste resources on old or
 """
 
 import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -31,16 +32,18 @@ def mock_repository():
     return MagicMock()
 
 
-def create_mock_issue(days_old: int) -> MagicMock:
-    """Create a mock issue with a proper datetime for created_at."""
-    issue = MagicMock()
-    issue.created_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days_old)
-    return issue
+# Fixed "current" time handed to the retriever as its clock, so issue ages never drift during a run
+MOCK_NOW = datetime.datetime(2025, 1, 31, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def create_mock_issue(days_old: int) -> SimpleNamespace:
+    """Create a data-only issue stub with a proper datetime for created_at."""
+    return SimpleNamespace(number=0, title="", body="", state="open", created_at=MOCK_NOW - datetime.timedelta(days=days_old))
 
 
 def test_get_recent_issues(mock_repository):
     """Test retrieving recent issues."""
-    retriever = IssueRetriever(mock_repository)
+    retriever = IssueRetriever(mock_repository, clock=lambda: MOCK_NOW)
 
     # Create mock issues with proper datetime objects
     mock_issues = [
@@ -55,7 +58,7 @@ def test_get_recent_issues(mock_repository):
 
 def test_get_recent_issues_with_state(mock_repository):
     """Test retrieving recent issues with specific state."""
-    retriever = IssueRetriever(mock_repository)
+    retriever = IssueRetriever(mock_repository, clock=lambda: MOCK_NOW)
 
     # Create mock issues with proper datetime objects
     mock_issues = [
@@ -71,12 +74,14 @@ def test_get_recent_issues_with_state(mock_repository):
     call_args = mock_repository.get_issues.call_args[1]
     assert call_args["state"] == "closed"
     assert "since" in call_args
-    assert isinstance(call_args["since"], datetime.datetime)
+    assert call_args["since"] == MOCK_NOW - datetime.timedelta(days=30)
+    assert call_args["sort"] == "created"
+    assert call_args["direction"] == "desc"
 
 
 def test_get_recent_issues_empty(mock_repository):
     """Test retrieving recent issues when none exist."""
-    retriever = IssueRetriever(mock_repository)
+    retriever = IssueRetriever(mock_repository, clock=lambda: MOCK_NOW)
     mock_repository.get_issues.return_value = []
 
     issues = retriever.get_recent_issues(days_back=30)
@@ -85,14 +90,18 @@ def test_get_recent_issues_empty(mock_repository):
 
 def test_get_recent_issues_all_old(mock_repository):
     """Test retrieving recent issues when all are too old."""
-    retriever = IssueRetriever(mock_repository)
+    retriever = IssueRetriever(mock_repository, clock=lambda: MOCK_NOW)
 
-    # Create mock issues with proper datetime objects
-    mock_issues = [
-        create_mock_issue(days)
-        for days in [35, 40]  # All older than 30 days
-    ]
-    mock_repository.get_issues.return_value = mock_issues
+    # Issues arrive newest first; record how far the retriever iterates
+    consumed = []
+
+    def paginated_issues():
+        for days in [35, 40]:  # All older than 30 days
+            consumed.append(days)
+            yield create_mock_issue(days)
+
+    mock_repository.get_issues.return_value = paginated_issues()
 
     issues = retriever.get_recent_issues(days_back=30)
     assert len(issues) == 0  # No issues within 30 days
+    assert consumed == [35]  # Stopped at the first issue outside the window
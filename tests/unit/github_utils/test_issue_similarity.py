@@ -12,42 +12,35 @@ The tests use real TF-IDF vectorization to ensure the similarity detection works
 in real-world scenarios, rather than just testing the mathematical correctness.
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from my_chat_gpt_utils.github_utils import IssueSimilarityAnalyzer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def realistic_issues():
     """Create realistic test issues with different topics and content."""
-    issues = []
-
-    # API-related issues
-    api_issue1 = MagicMock()
-    api_issue1.title = "Add rate limiting to REST API endpoints"
-    api_issue1.body = "We need to implement rate limiting for our REST API to prevent abuse. Should use token bucket algorithm."
-    issues.append(api_issue1)
-
-    api_issue2 = MagicMock()
-    api_issue2.title = "Implement rate limiting for API"
-    api_issue2.body = "Add rate limiting to protect our API endpoints from abuse. Consider using token bucket."
-    issues.append(api_issue2)
-
-    # UI-related issue
-    ui_issue = MagicMock()
-    ui_issue.title = "Fix button alignment in mobile view"
-    ui_issue.body = "The submit button is misaligned on mobile devices. Need to adjust CSS for better responsiveness."
-    issues.append(ui_issue)
-
-    # Issue with no body
-    no_body_issue = MagicMock()
-    no_body_issue.title = "Add rate limiting to REST API endpoints"
-    no_body_issue.body = None
-    issues.append(no_body_issue)
-
-    return issues
+    return [
+        # API-related issues
+        SimpleNamespace(
+            title="Add rate limiting to REST API endpoints",
+            body="We need to implement rate limiting for our REST API to prevent abuse. Should use token bucket algorithm.",
+        ),
+        SimpleNamespace(
+            title="Implement rate limiting for API",
+            body="Add rate limiting to protect our API endpoints from abuse. Consider using token bucket.",
+        ),
+        # UI-related issue
+        SimpleNamespace(
+            title="Fix button alignment in mobile view",
+            body="The submit button is misaligned on mobile devices. Need to adjust CSS for better responsiveness.",
+        ),
+        # Issue with no body
+        SimpleNamespace(title="Add rate limiting to REST API endpoints", body=None),
+    ]
 
 
 def test_similar_issues_have_high_similarity(realistic_issues):
@@ -85,10 +78,34 @@ def test_issue_with_no_body(realistic_issues):
 def test_empty_existing_issues():
     """Test handling of empty existing issues list."""
     analyzer = IssueSimilarityAnalyzer(similarity_threshold=0.6)
-    target_issue = MagicMock()
-    target_issue.title = "Test Issue"
-    target_issue.body = "Test body"
+    target_issue = SimpleNamespace(title="Test Issue", body="Test body")
     existing_issues = []
 
     similarities = analyzer.compute_similarities(target_issue, existing_issues)
     assert len(similarities) == 0
+
+
+def test_similarities_sorted_descending(realistic_issues):
+    """Test that matches are returned most similar first, with plain float scores."""
+    analyzer = IssueSimilarityAnalyzer(similarity_threshold=0.0)
+    target_issue = realistic_issues[0]
+    existing_issues = [realistic_issues[2], realistic_issues[1], realistic_issues[3]]
+
+    similarities = analyzer.compute_similarities(target_issue, existing_issues)
+    scores = [score for _, score in similarities]
+
+    assert scores == sorted(scores, reverse=True)
+    assert all(type(score) is float for score in scores)
+    assert similarities[0][0] is realistic_issues[3]  # Identical title ranks first
+
+
+def test_issue_without_text_skips_vectorizing(realistic_issues):
+    """Test that an issue with an empty title and body is not vectorized at all."""
+    analyzer = IssueSimilarityAnalyzer(similarity_threshold=0.6)
+    target_issue = SimpleNamespace(title="", body=None)
+
+    with patch.object(analyzer.vectorizer, "fit_transform") as mock_fit_transform:
+        similarities = analyzer.compute_similarities(target_issue, realistic_issues)
+
+    assert similarities == []
+    mock_fit_transform.assert_not_called()
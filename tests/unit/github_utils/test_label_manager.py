@@ -5,43 +5,76 @@ This module tests the GitHubLabelManager class and related functionality.
 All external dependencies are mocked to ensure reliable testing.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from my_chat_gpt_utils.exceptions import ProblemCauseSolution
 from my_chat_gpt_utils.github_utils import GitHubLabelManager
 
+LABELS_URL = "https://api.github.com/repos/owner/repo/labels"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def label_manager():
-    """Fixture providing a GitHub label manager instance."""
+    """Fixture providing a GitHub label manager instance, shared across tests."""
     return GitHubLabelManager("test-token")
 
 
+@pytest.fixture(autouse=True)
+def clear_label_cache():
+    """Drop labels cached by a previous test so every test starts with a cold label listing."""
+    GitHubLabelManager._label_cache.clear()
+    GitHubLabelManager._label_etags.clear()
+
+
 @pytest.fixture
 def mock_response():
     """Fixture providing a mock requests response."""
     mock = MagicMock(spec=requests.Response)
     mock.status_code = 200
+    mock.headers = {}
     return mock
 
 
+def test_session_pools_and_retries():
+    """Test that label calls go through one pooled adapter that retries transient GitHub failures."""
+    with patch("my_chat_gpt_utils.github_utils.HTTPAdapter", wraps=HTTPAdapter) as adapter_class:
+        GitHubLabelManager("test-token")
+
+    adapter_class.assert_called_once()
+    kwargs = adapter_class.call_args.kwargs
+    assert kwargs["pool_maxsize"] == GitHubLabelManager.max_concurrent_requests
+    assert kwargs["max_retries"].total == 3
+    assert 502 in kwargs["max_retries"].status_forcelist
+
+
+def test_worker_sessions_share_the_adapter(label_manager):
+    """Test that a worker thread gets its own session, mounted on the same pooled adapter."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        worker_session = executor.submit(label_manager._worker_session).result()
+
+    assert worker_session is not label_manager._session
+    assert worker_session.get_adapter(LABELS_URL) is label_manager._session.get_adapter(LABELS_URL)
+
+
 def test_ensure_labels_exist_new_labels(label_manager, mock_response):
     """Test creating new labels when they don't exist."""
     mock_response.json.return_value = [{"name": "existing-label"}]
     with (
-        patch("requests.get", return_value=mock_response),
-        patch("requests.post", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
+        patch.object(requests.Session, "post", return_value=mock_response),
     ):
         labels = ["new-label-1", "new-label-2"]
         label_manager.ensure_labels_exist("owner", "repo", labels)
 
         # Verify POST request was made for each new label
-        assert requests.post.call_count == 2
+        assert requests.Session.post.call_count == 2
         for label in labels:
-            requests.post.assert_any_call(
+            requests.Session.post.assert_any_call(
                 "https://api.github.com/repos/owner/repo/labels",
                 headers={
                     "Authorization": "token test-token",
@@ -55,15 +88,15 @@ def test_ensure_labels_exist_existing_labels(label_manager, mock_response):
     """Test handling existing labels."""
     mock_response.json.return_value = [{"name": "existing-label"}]
     with (
-        patch("requests.get", return_value=mock_response),
-        patch("requests.post", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
+        patch.object(requests.Session, "post", return_value=mock_response),
     ):
         labels = ["existing-label", "new-label"]
         label_manager.ensure_labels_exist("owner", "repo", labels)
 
         # Verify POST request was only made for the new label
-        assert requests.post.call_count == 1
-        requests.post.assert_called_once_with(
+        assert requests.Session.post.call_count == 1
+        requests.Session.post.assert_called_once_with(
             "https://api.github.com/repos/owner/repo/labels",
             headers={
                 "Authorization": "token test-token",
@@ -77,13 +110,13 @@ def test_ensure_labels_exist_custom_color(label_manager, mock_response):
     """Test creating labels with custom color."""
     mock_response.json.return_value = []
     with (
-        patch("requests.get", return_value=mock_response),
-        patch("requests.post", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
+        patch.object(requests.Session, "post", return_value=mock_response),
     ):
         labels = ["test-label"]
         label_manager.ensure_labels_exist("owner", "repo", labels, color="ff0000")
 
-        requests.post.assert_called_once_with(
+        requests.Session.post.assert_called_once_with(
             "https://api.github.com/repos/owner/repo/labels",
             headers={
                 "Authorization": "token test-token",
@@ -93,13 +126,114 @@ def test_ensure_labels_exist_custom_color(label_manager, mock_response):
         )
 
 
+def test_ensure_labels_exist_concurrent_create_failure(label_manager, mock_response):
+    """Test that a failure in one of the concurrently created labels is still reported."""
+    mock_response.json.return_value = []
+    created = MagicMock(spec=requests.Response)
+    created.status_code = 201
+    forbidden = MagicMock(spec=requests.Response)
+    forbidden.status_code = 403
+    forbidden.raise_for_status.side_effect = requests.exceptions.HTTPError("403 Forbidden", response=forbidden)
+
+    with (
+        patch.object(requests.Session, "get", return_value=mock_response),
+        patch.object(requests.Session, "post", side_effect=[created, forbidden]),
+        pytest.raises(ProblemCauseSolution) as exc_info,
+    ):
+        label_manager.ensure_labels_exist("owner", "repo", ["label-1", "label-2"])
+
+    assert "Insufficient permissions to manage labels" in str(exc_info.value)
+
+
+def test_ensure_labels_exist_connection_error(label_manager, mock_response):
+    """Test that a label creation failing without a response is reported and forgets the cached labels."""
+    mock_response.json.return_value = []
+
+    with (
+        patch.object(requests.Session, "get", return_value=mock_response),
+        patch.object(requests.Session, "post", side_effect=requests.exceptions.ConnectionError("reset")),
+        pytest.raises(ProblemCauseSolution) as exc_info,
+    ):
+        label_manager.ensure_labels_exist("owner", "repo", ["new-label"])
+
+    assert "GitHub API error: reset" in str(exc_info.value)
+    assert ("owner", "repo") not in GitHubLabelManager._label_cache
+
+
+def test_ensure_labels_exist_shares_known_labels(label_manager, mock_response):
+    """Test that repeated calls, even from another manager, skip the listing and only create new labels."""
+    mock_response.json.return_value = [{"name": "existing-label"}]
+    with (
+        patch.object(requests.Session, "get", return_value=mock_response) as mock_get,
+        patch.object(requests.Session, "post", return_value=mock_response) as mock_post,
+    ):
+        label_manager.ensure_labels_exist("owner", "repo", ["existing-label", "new-label"])
+        label_manager.ensure_labels_exist("owner", "repo", ["existing-label", "new-label"])
+
+    other_manager = GitHubLabelManager("other-token")
+    with patch.object(other_manager._session, "get") as other_get:
+        other_manager.ensure_labels_exist("owner", "repo", ["new-label"])
+
+    assert mock_get.call_count == 1
+    assert mock_post.call_count == 1  # new-label is created once and then remembered
+    other_get.assert_not_called()
+
+
+def test_ensure_labels_exist_revalidates_with_etag(label_manager):
+    """Test that a label missing from the cache revalidates the listing with If-None-Match and reuses it on 304."""
+    listing = MagicMock(spec=requests.Response)
+    listing.status_code = 200
+    listing.headers = {"ETag": '"abc123"'}
+    listing.json.return_value = [{"name": "existing-label"}]
+    not_modified = MagicMock(spec=requests.Response)
+    not_modified.status_code = 304
+    not_modified.headers = {}
+    created = MagicMock(spec=requests.Response)
+    created.status_code = 201
+
+    with (
+        patch.object(requests.Session, "get", side_effect=[listing, not_modified]) as mock_get,
+        patch.object(requests.Session, "post", return_value=created) as mock_post,
+    ):
+        label_manager.ensure_labels_exist("owner", "repo", ["existing-label"])
+        label_manager.ensure_labels_exist("owner", "repo", ["existing-label", "new-label"])
+
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc123"'
+    not_modified.json.assert_not_called()
+    mock_post.assert_called_once()
+    assert GitHubLabelManager._label_cache[("owner", "repo")] == {"existing-label", "new-label"}
+
+
+def test_ensure_labels_exist_refreshes_changed_listing(label_manager):
+    """Test that a changed listing replaces the cached labels, so a label created elsewhere is not posted again."""
+    listing = MagicMock(spec=requests.Response)
+    listing.status_code = 200
+    listing.headers = {"ETag": '"abc123"'}
+    listing.json.return_value = [{"name": "existing-label"}]
+    changed = MagicMock(spec=requests.Response)
+    changed.status_code = 200
+    changed.headers = {"ETag": '"def456"'}
+    changed.json.return_value = [{"name": "existing-label"}, {"name": "new-label"}]
+
+    with (
+        patch.object(requests.Session, "get", side_effect=[listing, changed]),
+        patch.object(requests.Session, "post") as mock_post,
+    ):
+        label_manager.ensure_labels_exist("owner", "repo", ["existing-label"])
+        label_manager.ensure_labels_exist("owner", "repo", ["new-label"])
+
+    mock_post.assert_not_called()
+    assert GitHubLabelManager._label_etags[("owner", "repo")] == '"def456"'
+
+
 def test_add_labels_to_issue_success(label_manager, mock_response):
     """Test successfully adding labels to an issue."""
-    with patch("requests.post", return_value=mock_response):
+    with patch.object(label_manager._session, "post", return_value=mock_response):
         result = label_manager.add_labels_to_issue("owner", "repo", 123, ["label1", "label2"])
         assert result is True
 
-        requests.post.assert_called_once_with(
+        label_manager._session.post.assert_called_once_with(
             "https://api.github.com/repos/owner/repo/issues/123/labels",
             headers={
                 "Authorization": "token test-token",
@@ -109,11 +243,10 @@ def test_add_labels_to_issue_success(label_manager, mock_response):
         )
 
 
-def test_add_labels_to_issue_failure(label_manager):
+def test_add_labels_to_issue_failure(label_manager, mock_response):
     """Test handling failure when adding labels."""
-    mock_response = MagicMock(spec=requests.Response)
     mock_response.status_code = 404
-    with patch("requests.post", return_value=mock_response), pytest.raises(ProblemCauseSolution) as exc_info:
+    with patch.object(label_manager._session, "post", return_value=mock_response), pytest.raises(ProblemCauseSolution) as exc_info:
         label_manager.add_labels_to_issue("owner", "repo", 123, ["label1"])
 
     assert "Issue or repository not found" in str(exc_info.value)
@@ -121,11 +254,11 @@ def test_add_labels_to_issue_failure(label_manager):
 
 def test_add_labels_to_issue_empty_labels(label_manager, mock_response):
     """Test adding empty list of labels."""
-    with patch("requests.post", return_value=mock_response):
+    with patch.object(label_manager._session, "post", return_value=mock_response):
         result = label_manager.add_labels_to_issue("owner", "repo", 123, [])
         assert result is True
 
-        requests.post.assert_called_once_with(
+        label_manager._session.post.assert_called_once_with(
             "https://api.github.com/repos/owner/repo/issues/123/labels",
             headers={
                 "Authorization": "token test-token",
@@ -1,7 +1,9 @@
 """Unit tests for my_chat_gpt_utils.prompts."""
 
+import builtins
 import os
 import tempfile
+from unittest.mock import patch
 
 from my_chat_gpt_utils.prompts import (
     DocumentationPrompt,
@@ -52,6 +54,55 @@ def test_load_analyze_issue_prompt_with_temp_superprompt_files():
             os.chdir(old)
 
 
+def test_load_analyze_issue_prompt_reads_templates_once(tmp_path, monkeypatch):
+    """Repeated prompt loads format cached template text instead of re-reading the files."""
+
+    sp = tmp_path / "SuperPrompt"
+    sp.mkdir()
+    (sp / "analyze_issue_system_prompt.txt").write_text("SYS {issue_types}", encoding="utf-8")
+    (sp / "analyze_issue_user_prompt.txt").write_text("USR {issue_title}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    with patch("builtins.open", wraps=builtins.open) as mock_open:
+        for i in range(100):
+            _, user = load_analyze_issue_prompt({"issue_title": f"Issue {i}"})
+            assert user == f"USR Issue {i}"
+
+    assert mock_open.call_count == 2  # One read per template file
+
+
+def test_system_prompt_is_stable_across_issues(tmp_path, monkeypatch):
+    """The system prompt ignores per-issue placeholders and is the same object for every issue."""
+
+    sp = tmp_path / "SuperPrompt"
+    sp.mkdir()
+    (sp / "analyze_issue_system_prompt.txt").write_text("SYS {issue_types} {issue_title}", encoding="utf-8")
+    (sp / "analyze_issue_user_prompt.txt").write_text("USR {issue_title}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    first_system, first_user = load_analyze_issue_prompt({"issue_title": "First"})
+    second_system, second_user = load_analyze_issue_prompt({"issue_title": "Second"})
+
+    assert first_system is second_system
+    assert "{issue_title}" in first_system
+    assert (first_user, second_user) == ("USR First", "USR Second")
+
+
+def test_system_prompt_accepts_unhashable_placeholders(tmp_path, monkeypatch):
+    """A list-valued placeholder cannot key the system prompt cache and is formatted uncached instead."""
+
+    sp = tmp_path / "SuperPrompt"
+    sp.mkdir()
+    (sp / "analyze_issue_system_prompt.txt").write_text("SYS {labels}", encoding="utf-8")
+    (sp / "analyze_issue_user_prompt.txt").write_text("USR {issue_title}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    system, user = load_analyze_issue_prompt({"issue_title": "t", "issue_body": "b", "labels": ["a", "b"]})
+
+    assert system == "SYS ['a', 'b']"
+    assert user == "USR t"
+
+
 def test_get_documentation_prompt_includes_fields():
     """Documentation prompt includes title, description, and type from item."""
 
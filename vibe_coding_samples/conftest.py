@@ -1,4 +1,8 @@
 import pytest
+from knight_cases import TEST_CASES
+
+# Argument names a test takes to be run once per knight-bishop case; the method slot may be named "_"
+KNIGHT_CASE_ARGS = ("start", "goal", "board_size", "bishop_pos", "expected")
 
 
 def pytest_configure(config):
@@ -7,12 +11,6 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "knight: marks tests related to the knight-bishop solver")
 
 
-def pytest_collection_modifyitems(config, items):
-    """Modify test items to apply knight-specific settings."""
-    # Only run tests in the vibe_coding_samples directory
-    items[:] = [item for item in items if "vibe_coding_samples" in str(item.fspath)]
-
-
 @pytest.fixture(autouse=True)
 def _configure_logging():
     """Configure logging for knight-bishop solver tests."""
@@ -21,3 +19,14 @@ def _configure_logging():
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s [%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)", datefmt="%Y-%m-%d %H:%M:%S"
     )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests taking the knight case arguments over TEST_CASES, with stable ids (case0, case1, ...)."""
+    if not all(name in metafunc.fixturenames for name in KNIGHT_CASE_ARGS):
+        return
+    method_arg = "method" if "method" in metafunc.fixturenames else "_"
+    metafunc.parametrize(
+        ["start", "goal", "board_size", "bishop_pos", method_arg, "expected"],
+        [pytest.param(*case, id=f"case{i}") for i, case in enumerate(TEST_CASES)],
+    )
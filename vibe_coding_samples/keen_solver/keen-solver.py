@@ -1,8 +1,56 @@
+import sys
+from functools import cache
 from math import prod
 
 import numpy as np
 
 
+@cache
+def factorize(n, size, puzzle_size, start=1):
+    """Digit tuples of length `size` whose product is n; cached, so shared sub-problems are solved once"""
+    if size == 1:
+        return ((n,),) if 1 <= n <= puzzle_size else ()
+    return tuple(
+        (i,) + factors
+        for i in range(start, puzzle_size + 1)
+        if n % i == 0
+        for factors in factorize(n // i, size - 1, puzzle_size, i)
+    )
+
+
+@cache
+def find_sums(n, size, puzzle_size, start=1):
+    """Digit tuples of length `size` that sum to n; cached, so shared sub-problems are solved once"""
+    if size == 1:
+        return ((n,),) if 1 <= n <= puzzle_size else ()
+    return tuple(
+        (i,) + sums for i in range(start, min(n - size + 1, puzzle_size + 1)) for sums in find_sums(n - i, size - 1, puzzle_size, i)
+    )
+
+
+@cache
+def get_possible_values(target, op, size, puzzle_size):
+    """Get possible values for a cage based on its operation and target"""
+    if op == "*":
+        # For multiplication, find all possible factor combinations
+        return factorize(target, size, puzzle_size)
+    elif op == "+":
+        # For addition, find all combinations that sum to target
+        return find_sums(target, size, puzzle_size)
+    elif op == "-":
+        # For subtraction, only valid for 2 cells
+        if size != 2:
+            return ()
+        return tuple((a, b) for a in range(1, puzzle_size + 1) for b in range(1, puzzle_size + 1) if abs(a - b) == target)
+    elif op == "/":
+        # For division, only valid for 2 cells
+        if size != 2:
+            return ()
+        digits = range(1, puzzle_size + 1)
+        return tuple((a, b) for a in digits for b in digits if max(a, b) / min(a, b) == target)
+    return ()
+
+
 def solve_keen(puzzle_size, cages):
     """
     Solve a Keen puzzle.
@@ -17,105 +65,67 @@ def solve_keen(puzzle_size, cages):
     Returns:
         A numpy array representing the solution, or None if no solution exists
     """
-    # Create empty grid
-    grid = np.zeros((puzzle_size, puzzle_size), dtype=int)
+    # Create empty grid; plain lists index much faster than numpy in this scalar loop
+    grid = [[0] * puzzle_size for _ in range(puzzle_size)]
+    # Bit k of row_mask[r] / col_mask[c] is set when digit k is already in row r / column c
+    row_mask = [0] * puzzle_size
+    col_mask = [0] * puzzle_size
 
-    def is_valid(grid, row, col, num):
+    def is_valid(row, col, num):
         """Check if placing num at (row, col) violates row/column constraints"""
-        # Check row
-        if num in grid[row, :]:
-            return False
+        return not ((row_mask[row] | col_mask[col]) >> num) & 1
+
+    def place(row, col, num):
+        """Put num at (row, col) and record it in the row and column masks"""
+        grid[row][col] = num
+        row_mask[row] |= 1 << num
+        col_mask[col] |= 1 << num
+
+    def clear(row, col):
+        """Empty (row, col) and remove its digit from the row and column masks"""
+        bit = 1 << grid[row][col]
+        row_mask[row] ^= bit
+        col_mask[col] ^= bit
+        grid[row][col] = 0
+
+    def cage_satisfied(target, op, cells):
+        """Check one cage's constraint; a cage with an empty cell is not violated yet"""
+        # Skip checking if any cell in the cage is still empty
+        if any(grid[r][c] == 0 for r, c in cells):
+            return True
 
-        # Check column
-        if num in grid[:, col]:
-            return False
+        values = [grid[r][c] for r, c in cells]
 
-        return True
-
-    def get_possible_values(target, op, size):
-        """Get possible values for a cage based on its operation and target"""
-        if op == "*":
-            # For multiplication, find all possible factor combinations
-            def factorize(n, size, start=1):
-                if size == 1:
-                    return [[n]] if 1 <= n <= puzzle_size else []
-                result = []
-                for i in range(start, puzzle_size + 1):
-                    if n % i == 0:
-                        for factors in factorize(n // i, size - 1, i):
-                            result.append([i] + factors)
-                return result
-
-            return factorize(target, size)
-        elif op == "+":
-            # For addition, find all combinations that sum to target
-            def find_sums(n, size, start=1):
-                if size == 1:
-                    return [[n]] if 1 <= n <= puzzle_size else []
-                result = []
-                for i in range(start, min(n - size + 1, puzzle_size + 1)):
-                    for sums in find_sums(n - i, size - 1, i):
-                        result.append([i] + sums)
-                return result
-
-            return find_sums(target, size)
+        if op == "+":
+            return sum(values) == target
         elif op == "-":
-            # For subtraction, only valid for 2 cells
-            if size != 2:
-                return []
-            return [[a, b] for a in range(1, puzzle_size + 1) for b in range(1, puzzle_size + 1) if abs(a - b) == target]
+            return len(values) != 2 or abs(values[0] - values[1]) == target
+        elif op == "*":
+            return prod(values) == target
         elif op == "/":
-            # For division, only valid for 2 cells
-            if size != 2:
-                return []
-            return [[a, b] for a in range(1, puzzle_size + 1) for b in range(1, puzzle_size + 1) if max(a, b) / min(a, b) == target]
-        return []
-
-    def satisfies_cages(grid, cages):
-        """Check if the current (partial) grid satisfies all cage constraints"""
-        for target, op, cells in cages:
-            # Skip checking if any cell in the cage is still empty
-            if any(grid[r, c] == 0 for r, c in cells):
-                continue
-
-            values = [grid[r, c] for r, c in cells]
-
-            if op == "+":
-                if sum(values) != target:
-                    return False
-            elif op == "-":
-                if len(values) == 2 and abs(values[0] - values[1]) != target:
-                    return False
-            elif op == "*":
-                if prod(values) != target:
-                    return False
-            elif op == "/":
-                if len(values) == 2 and max(values) / min(values) != target:
-                    return False
-            elif op is None:
-                if values[0] != target:
-                    return False
-
+            return len(values) != 2 or max(values) / min(values) == target
+        elif op is None:
+            return values[0] == target
         return True
 
     def solve_partial_cages(grid, cages):
         """Try to fill cells in cages that have limited possibilities"""
         changes = False
 
-        for target, op, cells in cages:
+        for cage_index, (_, _, cells) in enumerate(cages):
             # Skip if any cell in the cage is already filled
-            if any(grid[r, c] != 0 for r, c in cells):
+            if any(grid[r][c] != 0 for r, c in cells):
                 continue
 
             # Get possible values for this cage
-            possible_values = get_possible_values(target, op, len(cells))
+            possible_values = cage_possible_values[cage_index]
 
             # Filter out values that conflict with existing numbers in rows/columns
             valid_values = []
             for values in possible_values:
                 valid = True
                 for (r, c), val in zip(cells, values):
-                    if not is_valid(grid, r, c, val):
+                    if not is_valid(r, c, val):
                         valid = False
                         break
                 if valid:
@@ -124,39 +134,69 @@ def solve_keen(puzzle_size, cages):
             # If there's only one possibility, fill the cage
             if len(valid_values) == 1:
                 for (r, c), val in zip(cells, valid_values[0]):
-                    grid[r, c] = val
+                    place(r, c, val)
                     changes = True
 
         return changes, grid
 
-    def backtrack(grid, row=0, col=0):
-        """Solve the puzzle using backtracking"""
-        if row == puzzle_size:
-            return True
+    def backtrack():
+        """Solve the puzzle by backtracking over the empty cells with an explicit index, not recursion"""
+        empty_cells = [(r, c) for r in range(puzzle_size) for c in range(puzzle_size) if grid[r][c] == 0]
+        # next_num[i] is the first digit still to try at empty_cells[i]
+        next_num = [1] * len(empty_cells)
+        idx = 0
+
+        while 0 <= idx < len(empty_cells):
+            row, col = empty_cells[idx]
+            if grid[row][col] != 0:
+                # Returning to this cell after a dead end further on: undo its previous digit
+                clear(row, col)
+
+            # Digits allowed by the cage, absent from the row and column, and not yet tried here
+            candidates = cell_candidates[(row, col)] & ~(row_mask[row] | col_mask[col]) & -(1 << next_num[idx])
+            while candidates:
+                bit = candidates & -candidates
+                candidates ^= bit
+                num = bit.bit_length() - 1
+                place(row, col, num)
+                # Every other cage was already satisfied; only the one owning this cell can break
+                if cage_satisfied(*cell_to_cage[(row, col)]):
+                    break
+                clear(row, col)
+            else:
+                # No digit fits: reset this cell and step back to the previous one
+                next_num[idx] = 1
+                idx -= 1
+                continue
 
-        next_row = row + (col + 1) // puzzle_size
-        next_col = (col + 1) % puzzle_size
+            next_num[idx] = num + 1
+            idx += 1
 
-        if grid[row, col] != 0:
-            return backtrack(grid, next_row, next_col)
+        return idx == len(empty_cells)
 
-        for num in range(1, puzzle_size + 1):
-            if is_valid(grid, row, col, num):
-                grid[row, col] = num
-                if satisfies_cages(grid, cages):
-                    if backtrack(grid, next_row, next_col):
-                        return True
-                grid[row, col] = 0
+    # The cage each cell belongs to, so a placement only re-checks that cage
+    cell_to_cage = {cell: cage for cage in cages for cell in cage[2]}
 
-        return False
+    # Candidate value tuples per cage, computed once rather than on every partial-cage pass
+    cage_possible_values = [get_possible_values(target, op, len(cells), puzzle_size) for target, op, cells in cages]
+
+    # Bitmask per cell of every digit its cage allows (bit k set means digit k); single cells only allow their target
+    cell_candidates = {}
+    for (target, op, cells), possible_values in zip(cages, cage_possible_values):
+        mask = 1 << target if op is None else 0
+        for values in possible_values:
+            for value in values:
+                mask |= 1 << value
+        for cell in cells:
+            cell_candidates[cell] = mask
 
     # Try to solve partial cages before backtracking
     has_changes = True
     while has_changes:
         has_changes, grid = solve_partial_cages(grid, cages)
 
-    if backtrack(grid):
-        return grid
+    if backtrack():
+        return np.array(grid)
     else:
         return None
 
@@ -164,67 +204,53 @@ def solve_keen(puzzle_size, cages):
 def print_puzzle(grid, cages):
     """Print the puzzle solution with ASCII art"""
     size = len(grid)
-
-    # Create a grid of cell borders
-    borders = [[" " for _ in range(size * 2 + 1)] for _ in range(size * 2 + 1)]
+    # Every cell is as wide as the largest value, so two-digit puzzles stay aligned
+    cell = len(str(size))
+    height = size * 2 + 1
+    width = size * (cell + 1) + 1
+    # One flat buffer of ASCII bytes; each row is width characters plus a newline
+    stride = width + 1
+    buf = bytearray(b" " * (height * stride))
+    for i in range(height):
+        buf[i * stride + width] = ord("\n")
 
     # Fill in the corners
-    for i in range(0, size * 2 + 1, 2):
-        for j in range(0, size * 2 + 1, 2):
-            borders[i][j] = "+"
+    for i in range(0, height, 2):
+        for j in range(0, width, cell + 1):
+            buf[i * stride + j] = ord("+")
 
     # Fill in the numbers
     for i in range(size):
         for j in range(size):
-            borders[i * 2 + 1][j * 2 + 1] = str(grid[i][j])
+            start = (i * 2 + 1) * stride + j * (cell + 1) + 1
+            buf[start : start + cell] = str(grid[i][j]).rjust(cell).encode("ascii")
 
     # Draw cage borders
     for _, _, cells in cages:
         for r, c in cells:
             # Convert to border coordinates
             br = r * 2 + 1
-            bc = c * 2 + 1
+            bc = c * (cell + 1) + 1
 
             # Check adjacent cells in the same cage
             for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 nr, nc = r + dr, c + dc
+                # The border column left or right of the cell, or the cell's span in the row above or below
+                if dr == 0:  # horizontal
+                    start = br * stride + (bc - 1 if dc < 0 else bc + cell)
+                    end = start + 1
+                else:  # vertical
+                    start = (br + dr) * stride + bc
+                    end = start + cell
                 if (nr, nc) in cells:
                     # If adjacent cell is in same cage, remove border
-                    if dr == 0:  # horizontal
-                        borders[br][bc + dc] = " "
-                    else:  # vertical
-                        borders[br + dr][bc] = " "
+                    buf[start:end] = b" " * (end - start)
                 else:
                     # If adjacent cell is not in same cage, add border
-                    if dr == 0:  # horizontal
-                        borders[br][bc + dc] = "|"
-                    else:  # vertical
-                        borders[br + dr][bc] = "-"
+                    buf[start:end] = (b"|" if dr == 0 else b"-") * (end - start)
 
     # Print the puzzle
-    for row in borders:
-        print("".join(row))
-
-
-# Example usage
-puzzle_size = 6
-cages = [
-    (11, "+", [(0, 0), (0, 1), (1, 0)]),
-    (12, "*", [(0, 2), (1, 1), (1, 2)]),
-    (2, "-", [(0, 3), (0, 4)]),
-    (2, "/", [(0, 5), (1, 5)]),
-    (2, "/", [(1, 3), (2, 3)]),
-    (8, "*", [(1, 4), (2, 4), (3, 4)]),
-    (8, "+", [(2, 0), (3, 0), (3, 1)]),
-    (540, "*", [(2, 1), (2, 2), (3, 2), (3, 3)]),
-    (4, "-", [(2, 5), (3, 5)]),
-    (6, "*", [(4, 0), (5, 0)]),
-    (2, "-", [(4, 1), (5, 1)]),
-    (9, "+", [(4, 2), (4, 3)]),
-    (2, "/", [(4, 4), (5, 4)]),
-    (6, "+", [(4, 5), (5, 5)]),
-    (1, "-", [(5, 2), (5, 3)]),
-]
+    sys.stdout.write(buf.decode("ascii"))
 
 
 def validate_cages(puzzle_size, cages):
@@ -245,12 +271,37 @@ def validate_cages(puzzle_size, cages):
     print("Validation successful: every cell is in exactly one cage.")
 
 
-validate_cages(puzzle_size, cages)
+def main():
+    """Solve and print the example 6x6 puzzle"""
+    puzzle_size = 6
+    cages = [
+        (11, "+", [(0, 0), (0, 1), (1, 0)]),
+        (12, "*", [(0, 2), (1, 1), (1, 2)]),
+        (2, "-", [(0, 3), (0, 4)]),
+        (2, "/", [(0, 5), (1, 5)]),
+        (2, "/", [(1, 3), (2, 3)]),
+        (8, "*", [(1, 4), (2, 4), (3, 4)]),
+        (8, "+", [(2, 0), (3, 0), (3, 1)]),
+        (540, "*", [(2, 1), (2, 2), (3, 2), (3, 3)]),
+        (4, "-", [(2, 5), (3, 5)]),
+        (6, "*", [(4, 0), (5, 0)]),
+        (2, "-", [(4, 1), (5, 1)]),
+        (9, "+", [(4, 2), (4, 3)]),
+        (2, "/", [(4, 4), (5, 4)]),
+        (6, "+", [(4, 5), (5, 5)]),
+        (1, "-", [(5, 2), (5, 3)]),
+    ]
+
+    validate_cages(puzzle_size, cages)
+
+    solution = solve_keen(puzzle_size, cages)
+
+    if solution is not None:
+        print("Solution found:")
+        print_puzzle(solution, cages)
+    else:
+        print("No solution found. The puzzle might be incorrectly specified.")
 
-solution = solve_keen(puzzle_size, cages)
 
-if solution is not None:
-    print("Solution found:")
-    print_puzzle(solution, cages)
-else:
-    print("No solution found. The puzzle might be incorrectly specified.")
+if __name__ == "__main__":
+    main()
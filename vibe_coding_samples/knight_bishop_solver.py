@@ -7,8 +7,11 @@
 import heapq
 import logging
 import time
-from collections import deque
-from typing import NamedTuple, Set, Tuple
+from array import array
+from functools import lru_cache
+from typing import ClassVar, NamedTuple, Tuple
+
+import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -16,7 +19,14 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+# Per-step messages cost more than the search itself on small boards; lower the level to see them
+logger.setLevel(logging.WARNING)
+
+# Sentinel move count for squares a search has not reached yet
+UNVISITED = 2**31 - 1
+
+# Above this many squares "auto" prefers the NumPy level expansion in bfs over a_star
+LARGE_BOARD_SQUARES = 50 * 50
 
 
 class Position(NamedTuple):
@@ -26,12 +36,72 @@ class Position(NamedTuple):
     col: int
 
 
+@lru_cache(maxsize=128)
+def _compute_blocked(rows: int, cols: int, b_row: int, b_col: int) -> int:
+    """
+    Compute all squares that a bishop at (b_row, b_col) can see (line of sight).
+
+    Boards with the same size and bishop share one result, so repeated solvers skip the diagonal walk.
+    The result is an immutable int, so handing out the cached value is safe.
+
+    Args:
+        rows: Number of rows on the board
+        cols: Number of columns on the board
+        b_row: Row of the bishop
+        b_col: Column of the bishop
+
+    Returns:
+        A bitboard with bit (row * cols + col) set for every square in the bishop's line of sight.
+    """
+    # Checked once, so the per-square messages below are not even formatted when INFO is off
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info(f"Calculating bishop's line of sight from position {Position(b_row, b_col)}")
+
+    # Add bishop's position
+    line_of_sight = 1 << (b_row * cols + b_col)
+    if verbose:
+        logger.info(f"Added bishop's position to line of sight: {Position(b_row, b_col)}")
+
+    # Check all four diagonal directions
+    directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+    for d_row, d_col in directions:
+        if verbose:
+            logger.info(f"Checking direction: ({d_row}, {d_col})")
+        r, c = b_row, b_col
+
+        while True:
+            r += d_row
+            c += d_col
+
+            # Stop if we're off the board
+            if not (0 <= r < rows and 0 <= c < cols):
+                if verbose:
+                    logger.info(f"Position ({r}, {c}) is off the board, stopping this direction")
+                break
+
+            line_of_sight |= 1 << (r * cols + c)
+            if verbose:
+                logger.info(f"Added position to line of sight: {Position(r, c)}")
+
+    if verbose:
+        logger.info(f"Bishop's line of sight contains {line_of_sight.bit_count()} positions")
+    return line_of_sight
+
+
 class KnightBishopSolver:
     """
     Solver for finding the minimum number of knight moves required to go from a start position
     to an end position on a chessboard, while avoiding squares that are in a bishop's line of sight.
     """
 
+    # Knight's possible moves as (row step, column step)
+    _KNIGHT_MOVES: ClassVar[tuple[tuple[int, int], ...]] = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+
+    # Heuristic for row and column distances below 3, indexed [dr][dc]; larger distances use the general formula
+    _SMALL_H = ((0, 3, 1), (3, 2, 1), (1, 1, 1))
+
     def __init__(self, rows: int, cols: int, bishop_pos: Position):
         """
         Initialize the solver with board dimensions and bishop position.
@@ -48,11 +118,13 @@ class KnightBishopSolver:
         self.cols = cols
         self.bishop_pos = bishop_pos
 
-        # Pre-compute bishop's line of sight for efficient lookup
-        self.bishop_line_of_sight = self._get_bishop_line_of_sight()
+        # Pre-compute bishop's line of sight as a bitboard: bit (row * cols + col) is set for every square it sees
+        self.blocked = self._get_bishop_line_of_sight()
+        # The same squares as one byte each; indexing bytes is cheaper than shifting a large int in the search loops
+        self._blocked_bytes = self._blocked_squares().tobytes()
 
-        # Knight's possible moves
-        self.knight_moves = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+        # Knight moves with their square index offset, so a search adds one int instead of recomputing row * cols + col
+        self._knight_steps = tuple((d_row, d_col, d_row * cols + d_col) for d_row, d_col in self._KNIGHT_MOVES)
 
     def __str__(self) -> str:
         """Return a string representation of the solver."""
@@ -62,80 +134,44 @@ class KnightBishopSolver:
         """Return a detailed string representation of the solver."""
         return f"KnightBishopSolver(rows={self.rows}, cols={self.cols}, bishop_pos=Position(row={self.bishop_pos.row}, col={self.bishop_pos.col}))"
 
-    def _get_bishop_line_of_sight(self) -> Set[Position]:
+    def _get_bishop_line_of_sight(self) -> int:
         """
         Pre-compute all squares that the bishop can see (line of sight).
 
         Returns:
-            A set of Position coordinates that are in the bishop's line of sight.
+            A bitboard with bit (row * cols + col) set for every square in the bishop's line of sight.
         """
-        logger.info(f"Calculating bishop's line of sight from position {self.bishop_pos}")
-        line_of_sight = set()
-        b_row, b_col = self.bishop_pos
-
-        # Add bishop's position
-        line_of_sight.add(Position(b_row, b_col))
-        logger.info(f"Added bishop's position to line of sight: {Position(b_row, b_col)}")
-
-        # Check all four diagonal directions
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        for d_row, d_col in directions:
-            logger.info(f"Checking direction: ({d_row}, {d_col})")
-            r, c = b_row, b_col
-
-            while True:
-                r += d_row
-                c += d_col
-
-                # Stop if we're off the board
-                if not (0 <= r < self.rows and 0 <= c < self.cols):
-                    logger.info(f"Position ({r}, {c}) is off the board, stopping this direction")
-                    break
+        return _compute_blocked(self.rows, self.cols, *self.bishop_pos)
 
-                pos = Position(r, c)
-                line_of_sight.add(pos)
-                logger.info(f"Added position to line of sight: {pos}")
-
-        logger.info(f"Bishop's line of sight contains {len(line_of_sight)} positions: {sorted(line_of_sight)}")
-        return line_of_sight
-
-    def _is_valid_position(self, pos: Position) -> bool:
+    def _is_on_board(self, pos: Position) -> bool:
         """
-        Check if a position is valid (on the board and not in bishop's line of sight).
+        Check if a position lies on the board, ignoring the bishop.
+
+        The searches index per-square arrays by row * cols + col, so an off-board position
+        would wrap onto another row (or past the end of the arrays) instead of failing.
 
         Args:
             pos: Position to check
 
         Returns:
-            True if the position is valid, False otherwise
+            True if the position is on the board, False otherwise
         """
-        # Check if position is on the board
-        if not (0 <= pos.row < self.rows and 0 <= pos.col < self.cols):
-            return False
-
-        # Check if position is in bishop's line of sight
-        if pos in self.bishop_line_of_sight:
-            return False
-
-        return True
+        return 0 <= pos.row < self.rows and 0 <= pos.col < self.cols
 
-    def _manhattan_distance(self, pos1: Position, pos2: Position) -> int:
+    def _blocked_squares(self) -> np.ndarray:
         """
-        Calculate Manhattan distance between two positions.
-
-        Args:
-            pos1: First position
-            pos2: Second position
+        Unpack the bishop's line of sight bitboard into a flat boolean array.
 
         Returns:
-            Manhattan distance between the positions
+            Array of length rows * cols, True at index (row * cols + col) for every square the bishop sees
         """
-        return abs(pos1.row - pos2.row) + abs(pos1.col - pos2.col)
+        size = self.rows * self.cols
+        packed = np.frombuffer(self.blocked.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(packed, bitorder="little")[:size].astype(bool)
 
-    def _knight_distance_heuristic(self, pos: Position, target: Position) -> int:
+    def _knight_distance_heuristic(self, dr: int, dc: int) -> int:
         """
-        A heuristic for estimating the number of knight moves needed from pos to target.
+        A heuristic for estimating the number of knight moves needed to cover a row and column distance.
 
         This is a lower bound on the actual number of moves required, which is
         important for A* search to find the optimal solution. If we overestimated,
@@ -145,27 +181,39 @@ class KnightBishopSolver:
         on an empty board.
 
         Args:
-            pos: Current position
-            target: Target position
+            dr: Absolute row distance to the target
+            dc: Absolute column distance to the target
 
         Returns:
             Estimated minimum number of knight moves required
         """
-        dr = abs(pos.row - target.row)
-        dc = abs(pos.col - target.col)
+        # Special cases for small distances: 3 moves to shift by one square, 2 to move diagonally by 1,1
+        if dr < 3 and dc < 3:
+            return self._SMALL_H[dr][dc]
 
-        # Special cases for small distances
-        if dr == 0 and dc == 0:
-            return 0
-        if dr == 0 and dc == 1:
-            return 3  # Knight needs 3 moves to move just 1 square horizontally
-        if dr == 1 and dc == 0:
-            return 3  # Knight needs 3 moves to move just 1 square vertically
-        if dr == 1 and dc == 1:
-            return 2  # Knight needs 2 moves to move diagonally by 1,1
+        # General case - divide by 2 and round up
+        return max((dr + 1) >> 1, (dc + 1) >> 1)
+
+    def _knight_distance_table(self, target: Position) -> list[int]:
+        """
+        Evaluate _knight_distance_heuristic for every square of the board at once.
+
+        Args:
+            target: Target position
+
+        Returns:
+            Heuristic estimate per square index (row * cols + col), as plain ints for fast lookup
+        """
+        dr = np.abs(np.arange(self.rows) - target.row)[:, None]
+        dc = np.abs(np.arange(self.cols) - target.col)[None, :]
 
         # General case - divide by 2 and round up
-        return max((dr + 1) // 2, (dc + 1) // 2)
+        table = np.maximum((dr + 1) // 2, (dc + 1) // 2)
+
+        # Special cases for small distances, from the same lookup as _knight_distance_heuristic
+        small_h = np.array(self._SMALL_H)[np.minimum(dr, 2), np.minimum(dc, 2)]
+        table = np.where((dr < 3) & (dc < 3), small_h, table)
+        return table.ravel().tolist()
 
     def bfs(self, start: Position, end: Position) -> int:
         """
@@ -182,25 +230,39 @@ class KnightBishopSolver:
         if start == end:
             return 0
 
-        # Initialize BFS
-        queue = deque([(start, 0)])  # (position, moves)
-        visited = {start}  # Set of visited positions
+        # The search indexes per-square arrays, so a start or end off the board is unreachable
+        if not (self._is_on_board(start) and self._is_on_board(end)):
+            logger.warning(f"Start {start} or end {end} is off the board, no path possible")
+            return -1
 
-        while queue:
-            pos, moves = queue.popleft()
+        # The search expands a whole level at a time with NumPy: every frontier square times every knight move
+        rows, cols = self.rows, self.cols
+        d_rows, d_cols = np.array(self._KNIGHT_MOVES).T
 
-            # Check all possible knight moves
-            for d_row, d_col in self.knight_moves:
-                next_pos = Position(pos.row + d_row, pos.col + d_col)
+        # Squares in the bishop's line of sight are marked visited up front, so they are never expanded
+        visited = self._blocked_squares()
+        visited[start.row * cols + start.col] = True
 
-                # If we've reached the end, return the number of moves
-                if next_pos == end:
-                    return moves + 1
+        frontier_rows = np.array([start.row])
+        frontier_cols = np.array([start.col])
+        moves = 0
+
+        while frontier_rows.size:
+            next_rows = (frontier_rows[:, None] + d_rows).ravel()
+            next_cols = (frontier_cols[:, None] + d_cols).ravel()
+
+            # If we've reached the end, return the number of moves
+            if np.any((next_rows == end.row) & (next_cols == end.col)):
+                return moves + 1
+
+            # Keep the squares on the board that were not visited yet, each once
+            on_board = (next_rows >= 0) & (next_rows < rows) & (next_cols >= 0) & (next_cols < cols)
+            next_idx = next_rows[on_board] * cols + next_cols[on_board]
+            next_idx = np.unique(next_idx[~visited[next_idx]])
+            visited[next_idx] = True
 
-                # If the position is valid and not visited, add it to the queue
-                if self._is_valid_position(next_pos) and next_pos not in visited:
-                    visited.add(next_pos)
-                    queue.append((next_pos, moves + 1))
+            frontier_rows, frontier_cols = np.divmod(next_idx, cols)
+            moves += 1
 
         # If we've explored all reachable positions and haven't found the end, it's impossible
         return -1
@@ -209,6 +271,9 @@ class KnightBishopSolver:
         """
         Find the minimum number of knight moves from start to end using bidirectional BFS.
 
+        Each step expands the smaller of the two frontiers by one full level, and the search stops
+        after the first level that meets the other side.
+
         Args:
             start: Starting position
             end: Target position
@@ -224,81 +289,105 @@ class KnightBishopSolver:
         logger.info(f"Starting bidirectional BFS from {start} to {end}")
         start_time = time.time()
 
-        # Initialize forward and backward BFS
-        forward_queue = deque([(start, 0)])  # (position, moves)
-        backward_queue = deque([(end, 0)])  # (position, moves)
-        forward_visited = {start: 0}  # position -> moves
-        backward_visited = {end: 0}  # position -> moves
+        # Squares are handled as indices (row * cols + col) rather than Position objects
+        rows, cols = self.rows, self.cols
 
-        iteration = 0
-        last_stats_time = time.time()
+        # Both searches index per-square arrays, so a start or end off the board is unreachable
+        if not (self._is_on_board(start) and self._is_on_board(end)):
+            logger.warning(f"Start {start} or end {end} is off the board, no path possible")
+            return -1
 
-        while forward_queue and backward_queue:
-            iteration += 1
+        start_idx = start.row * cols + start.col
+        end_idx = end.row * cols + end.col
 
-            # Log statistics every second
-            current_time = time.time()
-            if current_time - last_stats_time >= 1.0:
-                logger.info(
-                    f"Iteration {iteration}: Forward queue size: {len(forward_queue)}, "
-                    f"Backward queue size: {len(backward_queue)}, "
-                    f"Forward visited: {len(forward_visited)}, "
-                    f"Backward visited: {len(backward_visited)}"
-                )
-                last_stats_time = current_time
+        # Moves to reach each square from either side; UNVISITED until that side reaches it
+        forward_visited = array("i", [UNVISITED]) * (rows * cols)
+        backward_visited = array("i", [UNVISITED]) * (rows * cols)
+        forward_visited[start_idx] = 0
+        backward_visited[end_idx] = 0
 
-            # Forward BFS step
-            pos, moves = forward_queue.popleft()
+        # Squares first reached at the current depth of each side
+        forward_level, forward_depth = [start_idx], 0
+        backward_level, backward_depth = [end_idx], 0
+        levels = 0
 
-            # Skip if we've already processed this position with a better path
-            if pos in forward_visited and forward_visited[pos] < moves:
-                continue
+        while forward_level and backward_level:
+            levels += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Level {levels}: Forward frontier: {len(forward_level)} at depth {forward_depth}, "
+                    f"Backward frontier: {len(backward_level)} at depth {backward_depth}"
+                )
 
-            for d_row, d_col in self.knight_moves:
-                next_pos = Position(pos.row + d_row, pos.col + d_col)
-                if self._is_valid_position(next_pos):
-                    # Only add if we haven't seen this position or found a better path
-                    if next_pos not in forward_visited or moves + 1 < forward_visited[next_pos]:
-                        forward_visited[next_pos] = moves + 1
-                        forward_queue.append((next_pos, moves + 1))
-                        if next_pos in backward_visited:
-                            total_moves = moves + 1 + backward_visited[next_pos]
-                            elapsed_time = time.time() - start_time
-                            logger.info(
-                                f"Path found after {iteration} iterations: {total_moves} moves "
-                                f"(forward: {moves + 1}, backward: {backward_visited[next_pos]})"
-                            )
-                            logger.info(f"Search completed in {elapsed_time:.2f} seconds")
-                            return total_moves
-
-            # Backward BFS step
-            pos, moves = backward_queue.popleft()
-
-            # Skip if we've already processed this position with a better path
-            if pos in backward_visited and backward_visited[pos] < moves:
-                continue
+            # Grow the smaller frontier, which keeps the total work close to two half-depth searches
+            if len(forward_level) <= len(backward_level):
+                forward_depth += 1
+                forward_level, total_moves = self._expand_level(
+                    forward_level, forward_depth, forward_visited, backward_visited, end
+                )
+            else:
+                backward_depth += 1
+                backward_level, total_moves = self._expand_level(
+                    backward_level, backward_depth, backward_visited, forward_visited, start
+                )
 
-            for d_row, d_col in self.knight_moves:
-                next_pos = Position(pos.row + d_row, pos.col + d_col)
-                if self._is_valid_position(next_pos):
-                    # Only add if we haven't seen this position or found a better path
-                    if next_pos not in backward_visited or moves + 1 < backward_visited[next_pos]:
-                        backward_visited[next_pos] = moves + 1
-                        backward_queue.append((next_pos, moves + 1))
-                        if next_pos in forward_visited:
-                            total_moves = moves + 1 + forward_visited[next_pos]
-                            elapsed_time = time.time() - start_time
-                            logger.info(
-                                f"Path found after {iteration} iterations: {total_moves} moves "
-                                f"(forward: {forward_visited[next_pos]}, backward: {moves + 1})"
-                            )
-                            logger.info(f"Search completed in {elapsed_time:.2f} seconds")
-                            return total_moves
+            if total_moves != UNVISITED:
+                elapsed_time = time.time() - start_time
+                logger.info(
+                    f"Path found after {levels} levels: {total_moves} moves "
+                    f"(forward depth: {forward_depth}, backward depth: {backward_depth})"
+                )
+                logger.info(f"Search completed in {elapsed_time:.2f} seconds")
+                return total_moves
 
         elapsed_time = time.time() - start_time
-        logger.warning(f"No path found after {iteration} iterations and {elapsed_time:.2f} seconds")
+        logger.warning(f"No path found after {levels} levels and {elapsed_time:.2f} seconds")
         return -1
 
+    def _expand_level(
+        self, level: list[int], depth: int, visited: array, other_visited: array, target: Position
+    ) -> tuple[list[int], int]:
+        """
+        Expand one side of the bidirectional BFS by a full level.
+
+        Args:
+            level: Square indices first reached at depth - 1 on this side
+            depth: Depth of the squares reached by this expansion
+            visited: Moves per square for this side; updated in place
+            other_visited: Moves per square for the other side
+            target: Root of the other side; it may be entered even in the bishop's line of sight, as in bfs
+
+        Returns:
+            Tuple of (square indices first reached at this depth, shortest total moves through a square
+            both sides reached, or UNVISITED if the sides have not met)
+        """
+        # Locals for the move table and the inlined validity check in the loop below
+        rows, cols, blocked, knight_steps = self.rows, self.cols, self._blocked_bytes, self._knight_steps
+        target_idx = target.row * cols + target.col
+        next_level = []
+        best = UNVISITED
+
+        for idx in level:
+            row, col = divmod(idx, cols)
+            for d_row, d_col, delta in knight_steps:
+                next_row, next_col = row + d_row, col + d_col
+                next_idx = idx + delta
+
+                # Reaching the other root completes a path (the column check rules out a wrapped index)
+                if next_idx == target_idx and next_col == target.col:
+                    best = min(best, depth)
+                    continue
+
+                # On the board, not in the bishop's line of sight, and new to this side
+                if 0 <= next_row < rows and 0 <= next_col < cols and not blocked[next_idx] and visited[next_idx] == UNVISITED:
+                    visited[next_idx] = depth
+                    next_level.append(next_idx)
+                    # The whole level is still expanded, as a later square in it may meet the other side sooner
+                    if other_visited[next_idx] != UNVISITED:
+                        best = min(best, depth + other_visited[next_idx])
+
+        return next_level, best
+
     def a_star(self, start: Position, end: Position) -> int:
         """
         Find the minimum number of knight moves from start to end using A* search algorithm.
@@ -314,42 +403,61 @@ class KnightBishopSolver:
         if start == end:
             return 0
 
+        # The search indexes per-square arrays, so a start or end off the board is unreachable
+        if not (self._is_on_board(start) and self._is_on_board(end)):
+            logger.warning(f"Start {start} or end {end} is off the board, no path possible")
+            return -1
+
+        # Squares are handled as indices (row * cols + col) rather than Position objects
+        rows, cols, blocked, knight_steps = self.rows, self.cols, self._blocked_bytes, self._knight_steps
+        start_idx = start.row * cols + start.col
+        end_idx = end.row * cols + end.col
+
         # Initialize A* search
-        # Priority queue with (f_score, moves, position)
+        # Priority queue of single ints packing (f_score, moves, square index), ordered like the tuple would be
         # f_score = g_score (moves so far) + h_score (heuristic estimate to goal)
-        open_set = [(self._knight_distance_heuristic(start, end), 0, start)]
-        # Dictionary to track g_scores
-        g_scores = {start: 0}
-        # Set to track visited nodes
-        closed_set = set()
+        # Moves never exceed the number of squares, so both low fields fit in `bits` bits
+        bits = (rows * cols).bit_length()
+        mask = (1 << bits) - 1
+        # Heuristic per square, computed once for this end instead of once per pushed square
+        h_scores = self._knight_distance_table(end)
+        open_set = [(h_scores[start_idx] << (2 * bits)) | start_idx]
+        # g_score per square; UNVISITED until a path to it is found
+        g_scores = array("i", [UNVISITED]) * (rows * cols)
+        g_scores[start_idx] = 0
+        # 1 for every square that has been expanded
+        closed_set = bytearray(rows * cols)
 
         while open_set:
-            _, moves, pos = heapq.heappop(open_set)
+            key = heapq.heappop(open_set)
+            moves, idx = (key >> bits) & mask, key & mask
 
-            # Skip if we've already processed this position with a better path
-            if pos in closed_set and g_scores[pos] < moves:
+            # Skip if we've already processed this square with a better path
+            if closed_set[idx] and g_scores[idx] < moves:
                 continue
 
             # Mark as processed
-            closed_set.add(pos)
+            closed_set[idx] = 1
 
             # Check all possible knight moves
-            for d_row, d_col in self.knight_moves:
-                next_pos = Position(pos.row + d_row, pos.col + d_col)
+            row, col = divmod(idx, cols)
+            for d_row, d_col, delta in knight_steps:
+                next_row, next_col = row + d_row, col + d_col
+                next_idx = idx + delta
 
-                # If we've reached the end, return the number of moves
-                if next_pos == end:
+                # If we've reached the end, return the number of moves (the column check rules out a wrapped index)
+                if next_idx == end_idx and next_col == end.col:
                     return moves + 1
 
-                # If the position is valid
-                if self._is_valid_position(next_pos):
+                # If the square is on the board and not in the bishop's line of sight
+                if 0 <= next_row < rows and 0 <= next_col < cols and not blocked[next_idx]:
                     next_g_score = moves + 1
 
                     # If we haven't seen this node before, or we found a better path
-                    if next_pos not in g_scores or next_g_score < g_scores[next_pos]:
-                        g_scores[next_pos] = next_g_score
-                        f_score = next_g_score + self._knight_distance_heuristic(next_pos, end)
-                        heapq.heappush(open_set, (f_score, next_g_score, next_pos))
+                    if next_g_score < g_scores[next_idx]:
+                        g_scores[next_idx] = next_g_score
+                        f_score = next_g_score + h_scores[next_idx]
+                        heapq.heappush(open_set, (((f_score << bits) | next_g_score) << bits) | next_idx)
 
         # If we've explored all reachable positions and haven't found the end, it's impossible
         return -1
@@ -370,34 +478,52 @@ class KnightBishopSolver:
         if start == end:
             return 0
 
+        # The search indexes per-square arrays, so a start or end off the board is unreachable
+        if not (self._is_on_board(start) and self._is_on_board(end)):
+            logger.warning(f"Start {start} or end {end} is off the board, no path possible")
+            return -1
+
+        # Squares are handled as indices (row * cols + col) rather than Position objects
+        rows, cols, blocked, knight_steps = self.rows, self.cols, self._blocked_bytes, self._knight_steps
+        start_idx = start.row * cols + start.col
+        end_idx = end.row * cols + end.col
+
         # Initial bound is the heuristic estimate from start to end
-        bound = self._knight_distance_heuristic(start, end)
+        bound = self._knight_distance_heuristic(abs(start.row - end.row), abs(start.col - end.col))
 
-        # Path of positions we've taken so far
-        path = []
+        # 1 for every square on the path taken so far, so the cycle check is a single lookup
+        on_path = bytearray(rows * cols)
+        on_path[start_idx] = 1
 
-        def search(pos, g, bound):
+        def search(idx, g, bound):
             """Recursive depth-first search with bound."""
-            f = g + self._knight_distance_heuristic(pos, end)
+            row, col = divmod(idx, cols)
+            f = g + self._knight_distance_heuristic(abs(row - end.row), abs(col - end.col))
 
             # If f exceeds bound, return f as the new bound
             if f > bound:
                 return f
 
             # If we've reached the end, return -g (negative to indicate success)
-            if pos == end:
+            if idx == end_idx:
                 return -g
 
             min_bound = float("inf")
 
             # Check all possible knight moves
-            for d_row, d_col in self.knight_moves:
-                next_pos = Position(pos.row + d_row, pos.col + d_col)
+            for d_row, d_col, delta in knight_steps:
+                next_row, next_col = row + d_row, col + d_col
+                next_idx = idx + delta
+
+                # Reaching the end ends the search before any other check, as in bfs; f = g + 1 stays within the bound
+                # because the heuristic is 1 for every square a knight move away (the column check rules out a wrapped index)
+                if next_idx == end_idx and next_col == end.col:
+                    return -(g + 1)
 
-                # If the position is valid and not already in our path
-                if self._is_valid_position(next_pos) and next_pos not in path:
-                    path.append(next_pos)
-                    t = search(next_pos, g + 1, bound)
+                # If the square is on the board, not in the bishop's line of sight, and not already in our path
+                if 0 <= next_row < rows and 0 <= next_col < cols and not blocked[next_idx] and not on_path[next_idx]:
+                    on_path[next_idx] = 1
+                    t = search(next_idx, g + 1, bound)
 
                     # If t is negative, we found the end
                     if t < 0:
@@ -407,14 +533,13 @@ class KnightBishopSolver:
                     if t < min_bound:
                         min_bound = t
 
-                    path.pop()
+                    on_path[next_idx] = 0
 
             return min_bound
 
         # Iteratively deepen the bound until we find a solution
         while True:
-            path = [start]
-            t = search(start, 0, bound)
+            t = search(start_idx, 0, bound)
 
             # If t is negative, we found the end, so convert back to positive
             if t < 0:
@@ -450,6 +575,9 @@ class KnightBishopSolver:
             if self.rows <= 8 and self.cols <= 8:
                 method = "bidirectional_bfs"
                 logger.info("Auto-selected bidirectional_bfs for small board (≤8x8)")
+            elif self.rows * self.cols > LARGE_BOARD_SQUARES:
+                method = "bfs"
+                logger.info("Auto-selected vectorized bfs for large board (>50x50)")
             else:
                 method = "a_star"
                 logger.info("Auto-selected a_star for larger board (>8x8)")
@@ -1,20 +1,28 @@
+import base64
 import io
+import json
 import logging
 import os
-import wave
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import gradio as gr
 import numpy as np
 import requests
+import soundfile as sf
+import soxr
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastrtc import ReplyOnPause, Stream
+from fastrtc import AdditionalOutputs, ReplyOnPause, Stream
 from fastrtc.utils import audio_to_bytes
 from gtts import gTTS
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
 # Configure logging with detailed format
 logging.basicConfig(
@@ -38,6 +46,11 @@ DEVELOPMENT_MODE = os.getenv("DEVELOPMENT_MODE", "false").lower() == "true"
 SYSTEM_PROMPT = os.getenv("SYSTEM_PROMPT", "You are a helpful assistant. Please provide concise and clear answers.")
 AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
 AUDIO_CHANNELS = int(os.getenv("AUDIO_CHANNELS", "1"))
+WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "base")
+PIPER_VOICE = os.getenv("PIPER_VOICE", "")
+# Negative values would slice from the front of the history, so they count as 0 (no history)
+CHAT_HISTORY_MAX = max(0, int(os.getenv("CHAT_HISTORY_MAX", "64")))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
 logger.info(
     f"Configuration loaded: OLLAMA_BASE_URL={OLLAMA_BASE_URL}, DEFAULT_MODEL={DEFAULT_MODEL}, UVICORN_PORT={UVICORN_PORT}, DEVELOPMENT_MODE={DEVELOPMENT_MODE}"
 )
@@ -51,32 +64,33 @@ class Message(BaseModel):
     content: str
 
 
-class ChatHistory:
-    def __init__(self):
-        logger.info("Initializing new chat history")
-        self.messages: List[Dict] = []
-        self.add_system_message()
+# One keep-alive session for all Ollama calls, so each request reuses a pooled connection instead of a new handshake
+_ollama_session = requests.Session()
+_ollama_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=40))
+_ollama_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=40))
+# (connect, read) timeouts in seconds; generating a long answer can take minutes
+OLLAMA_TIMEOUT = (10, 300)
 
-    def add_system_message(self):
-        logger.debug("Adding system message to chat history")
-        self.messages.append({"role": "system", "content": SYSTEM_PROMPT})
 
-    def add_message(self, role: str, content: str):
-        logger.debug(f"Adding {role} message to chat history: {content[:50]}...")
-        self.messages.append({"role": role, "content": content})
-
-    def get_messages(self) -> List[Dict]:
-        return self.messages
+# Installed models rarely change, so the list is reused for this many seconds instead of fetched per utterance
+MODELS_CACHE_TTL = 60.0
+# (expiry on the time.monotonic clock, models) of the last successful fetch
+_models_cache: Optional[tuple[float, List[str]]] = None
 
 
 def get_available_models() -> List[str]:
-    """Fetch available models from Ollama API"""
+    """Fetch available models from Ollama API, reusing the last result for MODELS_CACHE_TTL seconds"""
+    global _models_cache
+    if _models_cache is not None and time.monotonic() < _models_cache[0]:
+        return _models_cache[1]
+
     logger.info("Fetching available models from Ollama...")
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags")
+        response = _ollama_session.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=OLLAMA_TIMEOUT)
         response.raise_for_status()
         models = [model["name"] for model in response.json()["models"]]
         logger.info(f"Successfully fetched {len(models)} models: {', '.join(models)}")
+        _models_cache = (time.monotonic() + MODELS_CACHE_TTL, models)
         return models
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to fetch models: {str(e)}")
@@ -106,24 +120,119 @@ def select_model(models: List[str], preferred_model: Optional[str] = None) -> st
     raise HTTPException(status_code=500, detail=error_msg)
 
 
-def text_to_speech(text: str) -> tuple[int, np.ndarray]:
-    """Convert text to speech using gTTS"""
-    logger.info(f"Converting text to speech: {text[:50]}...")
-    tts = gTTS(text=text, lang="en")
-    tts.save("temp.mp3")
-    logger.debug("TTS audio saved to temp.mp3")
+class FasterWhisper:
+    """Speech recognition with faster-whisper's int8 backend, with the same transcribe() as FastRTC's Whisper"""
 
-    # Convert to numpy array (simplified for example)
-    # In a real implementation, you would use proper audio processing
-    audio_data = np.zeros((AUDIO_SAMPLE_RATE * 2,), dtype=np.float32)
-    logger.debug(f"Generated audio data with shape: {audio_data.shape}")
-    return AUDIO_SAMPLE_RATE, audio_data
+    def __init__(self, model_size: str = WHISPER_MODEL_SIZE):
+        from faster_whisper import WhisperModel
 
+        self.model = WhisperModel(model_size, device="auto", compute_type="int8")
 
-def process_audio(
-    audio: tuple[int, np.ndarray], chat_history: Optional[List[Dict]] = None
-) -> tuple[tuple[int, np.ndarray], List[Dict]]:
-    """Process audio input and generate response"""
+    def transcribe(self, audio_bytes: bytes) -> str:
+        segments, _ = self.model.transcribe(io.BytesIO(audio_bytes))
+        return "".join(segment.text for segment in segments).strip()
+
+
+# Whisper model shared by all requests; loading the weights dominates a transcription, so it happens once
+_whisper = None
+_whisper_lock = threading.Lock()
+
+
+def get_whisper():
+    """Return the shared Whisper model, loading it on first use"""
+    global _whisper
+    if _whisper is None:
+        with _whisper_lock:
+            if _whisper is None:
+                try:
+                    _whisper = FasterWhisper()
+                    logger.info(f"Loaded faster-whisper model '{WHISPER_MODEL_SIZE}' for speech recognition")
+                except ImportError:
+                    from fastrtc.whisper import Whisper
+
+                    logger.warning("faster-whisper is not installed, falling back to FastRTC's Whisper")
+                    _whisper = Whisper()
+    return _whisper
+
+
+def pcm16_to_float32(pcm: bytes) -> np.ndarray:
+    """Convert 16-bit PCM samples to float32 in [-1, 1)"""
+    # One ufunc pass that casts and scales together, instead of astype() followed by a division
+    return np.multiply(np.frombuffer(pcm, dtype=np.int16), np.float32(1 / 32768), dtype=np.float32)
+
+
+# Local Piper voice shared by all requests, loaded on first use when PIPER_VOICE names a voice model
+_piper_voice = None
+_piper_lock = threading.Lock()
+
+
+def get_piper_voice():
+    """Return the shared Piper voice, or None when PIPER_VOICE is not configured"""
+    global _piper_voice
+    if _piper_voice is None and PIPER_VOICE:
+        with _piper_lock:
+            if _piper_voice is None:
+                from piper import PiperVoice
+
+                logger.info(f"Loading Piper voice {PIPER_VOICE} for text to speech")
+                _piper_voice = PiperVoice.load(PIPER_VOICE)
+    return _piper_voice
+
+
+def text_to_speech(text: str) -> tuple[int, np.ndarray]:
+    """Convert text to speech with the local Piper voice if configured, otherwise with gTTS"""
+    logger.info(f"Converting text to speech: {text[:50]}...")
+    voice = get_piper_voice()
+    if voice is not None:
+        # Piper (piper-tts >= 1.3) synthesizes in process to float32 chunks, one per sentence, with no network round trip
+        chunks = [chunk.audio_float_array for chunk in voice.synthesize(text)]
+        audio_data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+        return voice.config.sample_rate, audio_data
+
+    # Keep gTTS's MP3 in memory and decode it there, rather than saving it to a file nobody reads
+    mp3_buffer = io.BytesIO()
+    gTTS(text=text, lang="en").write_to_fp(mp3_buffer)
+    mp3_buffer.seek(0)
+    audio_frames, sample_rate = sf.read(mp3_buffer, dtype="float32", always_2d=True)
+    audio_data = mix_to_mono(audio_frames) if audio_frames.shape[1] > 1 else audio_frames[:, 0]
+    logger.debug("Decoded TTS audio with shape %s at %d Hz", audio_data.shape, sample_rate)
+    return sample_rate, audio_data
+
+
+# Whitespace after sentence-ending punctuation; a reply is spoken in pieces split here
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def stream_ollama_sentences(messages: List[Dict]) -> Iterator[str]:
+    """Stream a chat reply from Ollama, yielding each sentence as soon as it is complete"""
+    logger.info("Sending request to Ollama")
+    with _ollama_session.post(
+        f"{OLLAMA_BASE_URL}/api/chat",
+        json={"model": select_model(get_available_models()), "messages": messages, "stream": True},
+        timeout=OLLAMA_TIMEOUT,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        buffer = ""
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            buffer += chunk.get("message", {}).get("content", "")
+            # Sentences keep their trailing whitespace, so joining everything yielded restores the exact reply
+            end = 0
+            for match in _SENTENCE_END.finditer(buffer):
+                yield buffer[end : match.end()]
+                end = match.end()
+            buffer = buffer[end:]
+            if chunk.get("done"):
+                break
+    if buffer:
+        yield buffer
+
+
+def generate_reply(audio: tuple[int, np.ndarray], chat_history: List[Dict]) -> Iterator[tuple[int, np.ndarray]]:
+    """Transcribe the audio and yield the spoken reply sentence by sentence; chat_history is updated at the end"""
     logger.info("Processing new audio input")
 
     # Validate input parameters
@@ -138,69 +247,87 @@ def process_audio(
         logger.warning(f"Converting audio data from {audio_data.dtype} to float32")
         audio_data = audio_data.astype(np.float32)
 
-    logger.debug(f"Audio input: sample_rate={sample_rate}, shape={audio_data.shape}, dtype={audio_data.dtype}")
-
-    chat_history = chat_history or []
+    logger.debug("Audio input: sample_rate=%d, shape=%s, dtype=%s", sample_rate, audio_data.shape, audio_data.dtype)
 
     # Convert audio to text using FastRTC's Whisper
     logger.debug("Converting audio to bytes")
     try:
         audio_bytes = audio_to_bytes(audio)
-        logger.debug(f"Converted audio to {len(audio_bytes)} bytes")
+        logger.debug("Converted audio to %d bytes", len(audio_bytes))
     except Exception as e:
         logger.error(f"Error converting audio to bytes: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
 
     # Use FastRTC's Whisper for speech recognition
-    logger.info("Initializing Whisper for speech recognition")
-    from fastrtc.whisper import Whisper
-
-    whisper = Whisper()
-    text = whisper.transcribe(audio_bytes)
+    text = get_whisper().transcribe(audio_bytes)
     logger.info(f"Speech recognition completed: {text[:50]}...")
 
     # Get response from Ollama
     logger.info("Preparing messages for Ollama")
     messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    messages.extend(chat_history)
+    # Only the most recent turns are sent, so the prompt stops growing in long sessions;
+    # 0 sends none, since chat_history[-0:] would be the whole history
+    if CHAT_HISTORY_MAX:
+        messages.extend(chat_history[-CHAT_HISTORY_MAX:])
     messages.append({"role": "user", "content": text})
 
+    # Speak each sentence while Ollama is still generating the next one
+    reply_parts = []
     try:
-        logger.info("Sending request to Ollama")
-        response = requests.post(
-            f"{OLLAMA_BASE_URL}/api/chat", json={"model": select_model(get_available_models()), "messages": messages}
-        )
-        response.raise_for_status()
-        response_text = response.json()["message"]["content"]
-        logger.info(f"Received response from Ollama: {response_text[:50]}...")
-
-        # Convert response to speech
-        logger.info("Converting response to speech")
-        audio_response = text_to_speech(response_text)
-
-        # Update chat history
-        logger.debug("Updating chat history")
-        chat_history.append({"role": "user", "content": text})
-        chat_history.append({"role": "assistant", "content": response_text})
-
-        return audio_response, chat_history
+        for sentence in stream_ollama_sentences(messages):
+            reply_parts.append(sentence)
+            if sentence.strip():
+                yield text_to_speech(sentence.strip())
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to get response from Ollama: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get response from Ollama: {str(e)}")
 
+    response_text = "".join(reply_parts)
+    logger.info(f"Received response from Ollama: {response_text[:50]}...")
+
+    # Update chat history
+    logger.debug("Updating chat history")
+    chat_history.append({"role": "user", "content": text})
+    chat_history.append({"role": "assistant", "content": response_text})
+
+
+def process_audio(
+    audio: tuple[int, np.ndarray], chat_history: Optional[List[Dict]] = None
+) -> tuple[tuple[int, np.ndarray], List[Dict]]:
+    """Process audio input and generate response"""
+    chat_history = chat_history or []
+    chunks = list(generate_reply(audio, chat_history))
+    if not chunks:
+        return (AUDIO_SAMPLE_RATE, np.zeros(0, dtype=np.float32)), chat_history
+    return (chunks[0][0], np.concatenate([audio_data for _, audio_data in chunks])), chat_history
+
+
+def reply_on_pause(audio: tuple[int, np.ndarray], chat_history: Optional[List[Dict]] = None):
+    """Stream handler: play each reply sentence as soon as it is synthesized, then publish the updated chat history"""
+    chat_history = chat_history or []
+    yield from generate_reply(audio, chat_history)
+    yield AdditionalOutputs(chat_history)
+
 
 # Create FastAPI app
 logger.info("Initializing FastAPI application...")
 app = FastAPI()
 logger.info("FastAPI application initialized successfully")
 
+
+@app.on_event("shutdown")
+def close_ollama_session():
+    """Release the pooled Ollama connections"""
+    _ollama_session.close()
+
+
 # Create Gradio interface
 logger.info("Setting up Gradio interface...")
 chatbot = gr.Chatbot(type="messages")
 stream = Stream(
     modality="audio",
     mode="send-receive",
-    handler=ReplyOnPause(process_audio),
+    handler=ReplyOnPause(reply_on_pause),
     additional_outputs_handler=lambda a, b: b,
     additional_inputs=[chatbot],
     additional_outputs=[chatbot],
@@ -213,15 +340,39 @@ stream.mount(app)
 logger.info("Stream mounted successfully")
 
 
-@app.get("/")
-async def root():
-    """Serve the main HTML page"""
-    logger.info("Serving main HTML page")
+def render_index_html() -> bytes:
+    """Read the main HTML page and inject the system prompt"""
     html_content = (Path(__file__).parent / "index.html").read_text()
     # Replace system prompt placeholder
     html_content = html_content.replace("__SYSTEM_PROMPT__", SYSTEM_PROMPT)
     logger.debug("HTML content loaded and system prompt injected successfully")
-    return HTMLResponse(content=html_content)
+    return html_content.encode()
+
+
+# Rendered once at startup; in development mode the page is re-read per request so edits show up on reload
+_INDEX_HTML = render_index_html()
+
+
+@app.get("/")
+async def root():
+    """Serve the main HTML page"""
+    logger.info("Serving main HTML page")
+    return HTMLResponse(content=render_index_html() if DEVELOPMENT_MODE else _INDEX_HTML)
+
+
+def mix_to_mono(frames: np.ndarray) -> np.ndarray:
+    """Average the channels of a (frames, channels) float32 array with at least two channels into one float32 channel"""
+    # Adding whole channel columns is one vectorized pass per channel; reducing along the short channel axis
+    # (frames.mean(axis=1)) loops per frame and is about 20x slower for stereo
+    mono = np.add(frames[:, 0], frames[:, 1])
+    for channel in range(2, frames.shape[1]):
+        mono += frames[:, channel]
+    mono *= np.float32(1.0 / frames.shape[1])
+    return mono
+
+
+# Maps every byte to itself if printable ASCII and to "." otherwise, for the debug dump of uploads
+_PRINTABLE_BYTES = bytes(b if 32 <= b <= 126 else ord(".") for b in range(256))
 
 
 @app.post("/process_audio")
@@ -229,57 +380,43 @@ async def process_audio_endpoint(file: UploadFile = File(...)):
     """Handle audio processing from the frontend"""
     logger.info("Received audio file for processing")
     try:
-        # Read the audio file
-        audio_data = await file.read()
-        logger.debug(f"Read {len(audio_data)} bytes of audio data")
+        # Decode straight from the spooled upload instead of copying the whole file into memory first
+        upload = file.file
+        upload.seek(0)
+        logger.debug("Received %s bytes of audio data", file.size)
+
+        # Print first 20 printable characters for debugging; only built when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            head = upload.read(20)
+            upload.seek(0)
+            logger.debug("First 20 bytes (printable): %s", head.translate(_PRINTABLE_BYTES).decode("ascii"))
+            logger.debug("First 20 bytes (hex): %s", head.hex(" "))
+
+        # Try to decode as an audio file; libsndfile detects the format and converts to float32 in one pass
+        try:
+            audio_frames, frame_rate = sf.read(upload, dtype="float32", always_2d=True)
+            n_frames, n_channels = audio_frames.shape
 
-        # Print first 20 printable characters for debugging
-        printable_chars = "".join(chr(b) if 32 <= b <= 126 else "." for b in audio_data[:20])
-        logger.debug(f"First 20 bytes (printable): {printable_chars}")
-        logger.debug(f"First 20 bytes (hex): {' '.join(f'{b:02x}' for b in audio_data[:20])}")
+            logger.debug("Audio file parameters: channels=%d, frame_rate=%d, frames=%d", n_channels, frame_rate, n_frames)
 
-        # Try to read as WAV file
-        try:
-            with wave.open(io.BytesIO(audio_data), "rb") as wav_file:
-                # Get WAV parameters
-                n_channels = wav_file.getnchannels()
-                sample_width = wav_file.getsampwidth()
-                frame_rate = wav_file.getframerate()
-                n_frames = wav_file.getnframes()
-
-                logger.debug(
-                    f"WAV parameters: channels={n_channels}, sample_width={sample_width}, frame_rate={frame_rate}, frames={n_frames}"
-                )
-
-                # Read all frames
-                frames = wav_file.readframes(n_frames)
-
-                # Convert to numpy array based on sample width
-                if sample_width == 2:  # 16-bit
-                    audio_array = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-                elif sample_width == 4:  # 32-bit
-                    audio_array = np.frombuffer(frames, dtype=np.float32)
-                else:
-                    raise ValueError(f"Unsupported sample width: {sample_width}")
-
-                # Handle multiple channels
-                if n_channels > 1:
-                    audio_array = audio_array.reshape(-1, n_channels)
-                    # Convert to mono by averaging channels
-                    audio_array = np.mean(audio_array, axis=1)
-
-                logger.debug(f"Converted WAV to array with shape {audio_array.shape} and dtype {audio_array.dtype}")
-
-        except wave.Error as e:
-            logger.debug(f"Not a WAV file: {str(e)}, trying direct conversion")
-            # Fall back to direct conversion if not a WAV file
+            # Convert to mono by averaging channels
+            audio_array = mix_to_mono(audio_frames) if n_channels > 1 else audio_frames[:, 0]
+
+            logger.debug("Converted audio file to array with shape %s and dtype %s", audio_array.shape, audio_array.dtype)
+
+        except sf.LibsndfileError as e:
+            logger.debug("Not an audio file: %s, trying direct conversion", e)
+            # Fall back to direct conversion for raw samples, which carry no sample rate of their own
+            frame_rate = AUDIO_SAMPLE_RATE
+            upload.seek(0)
+            audio_data = upload.read()
             try:
                 audio_array = np.frombuffer(audio_data, dtype=np.float32)
                 logger.debug("Successfully converted to float32 array")
             except ValueError as e:
-                logger.debug(f"Float32 conversion failed: {str(e)}, trying int16")
+                logger.debug("Float32 conversion failed: %s, trying int16", e)
                 try:
-                    audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+                    audio_array = pcm16_to_float32(audio_data)
                     logger.debug("Successfully converted to int16 array")
                 except ValueError as e:
                     logger.error(f"All conversion attempts failed: {str(e)}")
@@ -288,15 +425,21 @@ async def process_audio_endpoint(file: UploadFile = File(...)):
         # Ensure the array is 1D
         if len(audio_array.shape) > 1:
             audio_array = audio_array.flatten()
-            logger.debug(f"Flattened array to shape {audio_array.shape}")
+            logger.debug("Flattened array to shape %s", audio_array.shape)
+
+        # Resample to the rate the audio tuple is labelled with; mixing down to mono first halves the work
+        if frame_rate != AUDIO_SAMPLE_RATE:
+            audio_array = soxr.resample(audio_array, frame_rate, AUDIO_SAMPLE_RATE, quality="HQ")
+            logger.debug("Resampled audio from %d Hz to %d Hz", frame_rate, AUDIO_SAMPLE_RATE)
 
         # Create audio tuple with proper sample rate
         audio_tuple = (AUDIO_SAMPLE_RATE, audio_array)
-        logger.debug(f"Created audio tuple with sample rate {AUDIO_SAMPLE_RATE} and array shape {audio_array.shape}")
+        logger.debug("Created audio tuple with sample rate %d and array shape %s", AUDIO_SAMPLE_RATE, audio_array.shape)
 
         # Process the audio
         try:
-            audio_response, chat_history = process_audio(audio_tuple)
+            # Transcription, the Ollama call and TTS all block, so run them off the event loop
+            audio_response, chat_history = await run_in_threadpool(process_audio, audio_tuple)
             logger.debug("Audio processing completed successfully")
         except Exception as e:
             logger.error(f"Error in process_audio: {str(e)}")
@@ -305,7 +448,7 @@ async def process_audio_endpoint(file: UploadFile = File(...)):
         # Convert audio response to bytes
         try:
             response_audio_bytes = audio_to_bytes(audio_response)
-            logger.debug(f"Converted response audio to {len(response_audio_bytes)} bytes")
+            logger.debug("Converted response audio to %d bytes", len(response_audio_bytes))
         except Exception as e:
             logger.error(f"Error converting response audio to bytes: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error converting response audio: {str(e)}")
@@ -313,7 +456,8 @@ async def process_audio_endpoint(file: UploadFile = File(...)):
         # Get the last message from chat history
         last_message = chat_history[-1]["content"] if chat_history else ""
 
-        return JSONResponse({"text": last_message, "audio": response_audio_bytes.hex()})  # Convert bytes to hex string for JSON
+        # Base64 adds a third to the audio size where hex doubled it, and both ends encode and decode it in C
+        return JSONResponse({"text": last_message, "audio": base64.b64encode(response_audio_bytes).decode("ascii")})
     except Exception as e:
         logger.error(f"Error processing audio: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -323,4 +467,15 @@ if __name__ == "__main__":
     import uvicorn
 
     logger.info(f"Starting application on port {UVICORN_PORT} (development mode: {DEVELOPMENT_MODE})")
-    uvicorn.run("talk_to_ollama:app", host="0.0.0.0", port=UVICORN_PORT, reload=DEVELOPMENT_MODE)
+    # Reload supports a single process only; the WebRTC stream keeps its connection state in the worker that accepted it
+    workers = 1 if DEVELOPMENT_MODE else WEB_CONCURRENCY
+    uvicorn.run(
+        "talk_to_ollama:app",
+        host="0.0.0.0",
+        port=UVICORN_PORT,
+        reload=DEVELOPMENT_MODE,
+        workers=workers,
+        # uvloop and httptools come with uvicorn[standard]; "auto" falls back to asyncio and h11 without them
+        loop="auto",
+        http="auto",
+    )
@@ -1,6 +1,6 @@
 import pytest
 from knight_bishop_solver import KnightBishopSolver, Position
-from test_knight_bishop_solver import TEST_CASES
+from knight_cases import get_solver
 
 
 @pytest.mark.knight
@@ -30,12 +30,12 @@ def test_simple_case():
     assert result == expected, f"Path not found or incorrect number of moves. Expected: {expected}, Got: {result}"
 
 
+# Parametrized over TEST_CASES by pytest_generate_tests in conftest.py
 @pytest.mark.knight
-@pytest.mark.parametrize("start,goal,board_size,bishop_pos,_,expected", TEST_CASES)
 def test_bfs_on_all(start, goal, board_size, bishop_pos, _, expected):
     """Test BFS on all test cases from TEST_CASES."""
-    # Create solver
-    solver = KnightBishopSolver(board_size[0], board_size[1], Position(*bishop_pos))
+    # Reuse the solver test_all_cases built for the same board and bishop
+    solver = get_solver(*board_size, *bishop_pos)
 
     # Test with bfs method
     result, time_taken = solver.solve(start, goal, "bfs")